@@ -1,3 +1,41 @@
+import re
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+
+try:
+    # google-re2: linear-time DFA engine, optional
+    import re2
+except ImportError:
+    re2 = None
+
+# methods Router keeps route tables for; the set makes the guard one hash lookup
+METHODS = ('GET', 'POST')
+_ALLOWED_METHODS = frozenset(METHODS)
+
+# bound on cached (method, path) resolutions kept by Router
+CACHE_SIZE = 1000
+
+# segment kinds of a compiled route pattern
+KIND_STATIC = 0
+KIND_PARAM = 1
+KIND_WILD = 2
+
+
+def _method_error(method):
+    # only built on the rejection path
+    return f"{method} not allowed. Only allowed methods are {','.join(METHODS)}"
+
+
+def _compile_packed(source):
+    # route regexes have no backreferences, so re2 can always take them;
+    # fall back to re if it rejects the dialect or isn't installed
+    if re2 is not None:
+        try:
+            return re2.compile(source)
+        except re2.error:
+            pass
+    return re.compile(source)
 
 
 class Router:
@@ -8,112 +46,145 @@ class Router:
             'POST': {}
         }
 
-        self.param_routes = {
+        # param and wildcard routes in registration order, per method
+        self.dynamic_routes = {
             'GET': [],
-            'POST' : []
+            'POST': []
         }
 
-        self.wildcard_routes = {
-            'GET': [],
-            'POST': []
+        # dynamic routes of a method packed into one regex per first path
+        # segment, so a lookup is a C-level fullmatch against only the routes
+        # sharing that prefix ('' holds routes starting with a param/wildcard);
+        # wildcard routes get their own regex so they can be tried last
+        # method -> {(first segment, is wildcard): (regex, {outer group index: (handler, ((group, param), ...))})}
+        self._packed = {
+            'GET': {},
+            'POST': {}
         }
 
-    def _has_params(self, path):
-        return '{' in path and '}' in path
+        # (method, path) -> (handler, params) for recently resolved dynamic paths
+        self._cache = OrderedDict()
+        # the LRU bookkeeping (move_to_end / popitem) isn't safe to run
+        # from several threads at once, every _cache access takes this
+        self._cache_lock = threading.Lock()
 
-    def _has_wildcards(self, path):
-        return '{*' in path and '}' in path
+    def _compile_pattern(self, pattern):
+        # /api/v1/users/{id} -> ((0, 'api'), (0, 'v1'), (0, 'users'), (1, 'id'))
+        # patterns are static, so segments are classified once at registration
+        # a segment is either all of {name} / {*name} or a literal
+        compiled = []
+        for seg in pattern.strip('/').split('/'):
+            if seg[:2] == '{*':
+                compiled.append((KIND_WILD, seg[2:-1]))
+            elif seg[:1] == '{':
+                compiled.append((KIND_PARAM, seg[1:-1]))
+            else:
+                compiled.append((KIND_STATIC, seg))
+        return tuple(compiled)
+
+    def _pack(self, method):
+        buckets = {}
+        for route in self.dynamic_routes[method]:
+            kind, name = route['compiled'][0]
+            first = name if kind == KIND_STATIC else ''
+            wild = route['compiled'][-1][0] == KIND_WILD
+            buckets.setdefault((first, wild), []).append(route)
+        self._packed[method] = {key: self._pack_routes(routes)
+                                for key, routes in buckets.items()}
+
+    def _pack_routes(self, routes):
+        # every route becomes one alternative wrapped in its own group, so
+        # match.lastindex tells which route matched:
+        # /api/v1/users/{id}  -> (api/v1/users/(?P<p2>[^/]+))
+        # /api/v1/files/{*path} -> (api/v1/files(?:/(?P<p4>.*))?)
+        fragments = []
+        targets = {}
+        group_index = 0
+        for route in routes:
+            group_index += 1
+            outer = group_index
+            parts = []
+            groups = []
+            wildcard = ''
+            for kind, name in route['compiled']:
+                if kind == KIND_STATIC:
+                    parts.append(re.escape(name))
+                    continue
+                group_index += 1
+                group = f"p{group_index}"
+                groups.append((group, name))
+                if kind == KIND_PARAM:
+                    parts.append(f"(?P<{group}>[^/]+)")
+                else:
+                    wildcard = f"(?P<{group}>.*)"
+                    break
+            fragment = '/'.join(parts)
+            if wildcard:
+                # captures all remaining segments, possibly none
+                fragment = f"{fragment}(?:/{wildcard})?" if fragment else wildcard
+            fragments.append(f"({fragment})")
+            targets[outer] = (route['handler'], tuple(groups))
+        return _compile_packed('|'.join(fragments)), targets
 
     def add_route(self, path, method, handler):
         # /api/v1/users/{id}
         # /api/v1/users/{id}/posts/{pid}
-        if method not in self.routes.keys():
-            return f"{method} not allowed. Only allowed methods are {','.join(list(self.routes.keys()))}"
+        if method not in _ALLOWED_METHODS:
+            return _method_error(method)
         
-        if self._has_wildcards(path):
-            self.wildcard_routes[method].append({
-                'pattern': path, 
+        compiled = self._compile_pattern(path)
+        if any(kind != KIND_STATIC for kind, _ in compiled):
+            self.dynamic_routes[method].append({
+                'pattern': path,
+                'compiled': compiled,
                 'handler': handler
             })
-        elif self._has_params(path):
-            self.param_routes[method].append({
-                'pattern': path, 
-                'handler': handler
-            })
-
+            self._pack(method)
+            # a new pattern can change how cached paths resolve
+            with self._cache_lock:
+                self._cache.clear()
         else:
             self.routes[method][path] = handler
 
-    def _get_match_params(self, path, pattern):
-
-        s1 = path.strip('/').split('/')
-        s2 = pattern.strip('/').split('/')
-        
-        if len(s1) != len(s2):
-            return None
-
-        params = {}
-        for path_seg, pattern_seg in zip(s1, s2):
-            if self._has_params(pattern_seg):
-                key = pattern_seg.replace('{','')
-                key = key.replace('}','')
-                value = path_seg
-                params[key] = value
-                continue
-            if path_seg != pattern_seg:
-                return None
-        return params
-
-    def _get_wildcard_params(self, path, pattern):
-        # wildcard pattern
-        # /api/v1/files/{*path}
-        s1 = path.strip('/').split('/')
-        s2 = pattern.strip('/').split('/')
-        params = {}
-        for i, seg in enumerate(s2):
-            if self._has_wildcards(seg):
-                # we have reached the point where its the end
-                key = seg.replace('{*','').replace('}','')
-                value = s1[i:]
-                value = "/".join(value)
-                params[key] = value
-                break
-            elif self._has_params(seg):
-                key = seg.replace('{','').replace('}','')
-                if i >= len(s1):
-                    return None
-                value = s1[i]
-                params[key] = value
-            else:
-                # we are till the same path
-                if i > len(s1) or seg != s1[i]:
-                     return None 
-        return params
-
     def resolve_route(self, path: str, method: str):
-        if method not in self.routes.keys():
-            return f"{method} not allowed. Only allowed methods are {','.join(list(self.routes.keys()))}"
+        if method not in _ALLOWED_METHODS:
+            return _method_error(method)
         exact_match =  self.routes[method].get(path)
         if exact_match:
             # /api/v1/users/
             return {'handler':exact_match, 'params': None}
+        key = (method, path)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached:
+                self._cache.move_to_end(key)
+        if cached:
+            return {'handler': cached[0], 'params': cached[1]}
         # check if it matches the pattern
         # /api/v1/users/{id} --> it will store as that
-        for route in self.param_routes[method]:
-            pattern = route['pattern']
-            handler = route['handler']
-            params = self._get_match_params(path, pattern)
-            if params:
-                return {'handler': handler, 'params': params} 
-
-        for route in self.wildcard_routes[method]:
-            pattern = route['pattern']
-            handler = route['handler']
-            params = self._get_wildcard_params(path, pattern)
-            if params != None:
-                return {'handler': handler, 'params': params} 
-        
-        
+        buckets = self._packed[method]
+        clean_path = path.strip('/')
+        first = clean_path.partition('/')[0]
+        match = None
+        # param routes before wildcard ones, and within each kind routes under
+        # the path's own first segment before root-level ones
+        for bucket in ((first, False), ('', False), (first, True), ('', True)):
+            packed = buckets.get(bucket)
+            if packed:
+                match = packed[0].fullmatch(clean_path)
+                if match:
+                    break
+        if match:
+            handler, groups = packed[1][match.lastindex]
+            # read-only view so a caller can't corrupt the cached entry
+            params = MappingProxyType({name: match.group(group) or ''
+                                       for group, name in groups})
+            with self._cache_lock:
+                self._cache[key] = (handler, params)
+                if len(self._cache) > CACHE_SIZE:
+                    self._cache.popitem(last=False)
+            return {'handler': handler, 'params': params}
+
         return '404 - Not Found'
 
 
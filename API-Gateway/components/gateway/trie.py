@@ -1,10 +1,20 @@
 # gateway/core/router.py
 
+import sys
 from typing import Dict, List, Optional, Callable, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 
 
+# Trie match branches, tried in this order at every node
+STATIC = 0
+PARAM = 1
+WILDCARD = 2
+
+# Marks a parameter name that had no value before this level set it
+_UNSET = object()
+
+
 class HTTPMethod(Enum):
     GET = "GET"
     POST = "POST"
@@ -33,6 +43,12 @@ class TrieNode:
     3. Stores handlers per HTTP method
     """
 
+    # Fixed attribute set: no per-node __dict__, and attribute reads in
+    # the match loop become slot lookups
+    __slots__ = ('static_children', 'param_child', 'param_name',
+                 'wildcard_child', 'wildcard_name', 'handlers',
+                 'route_pattern', 'is_endpoint')
+
     def __init__(self):
         # Static children: exact string matches like "api", "users"
         # Fast O(1) lookup using dictionary
@@ -98,21 +114,93 @@ class RouteTrie:
         """
         Find a matching route for the given method and path.
 
+        Walks the trie with an explicit stack instead of recursion, trying
+        node types in priority order and backtracking on dead ends:
+        1. Static children (highest priority - exact matches)
+        2. Parameter children (medium priority - extract value)
+        3. Wildcard children (lowest priority - catch remaining)
+
         Returns RouteMatch with handler and extracted parameters,
         or None if no match found.
         """
-        # Parse the path into segments (similar to pattern parsing)
-        segments = self._parse_path(path)
+        # Parse the path into segments: drop one leading and one trailing
+        # slash with a single slice, "/api/users/123/" -> "api/users/123".
+        # Interned segments compare by identity against the interned
+        # static_children keys, so the dict lookup skips the string compare
+        start = 1 if path[:1] == '/' else 0
+        end = -1 if len(path) > start and path[-1] == '/' else None
+        clean_path = path[start:end]
+        intern = sys.intern
+        segments = [intern(s) for s in clean_path.split('/')] if clean_path else []
+        count = len(segments)
 
-        # Try to match using recursive traversal
         params = {}
-        handler = self._match_recursive(self.root, segments, 0, params)
-
-        if handler and method in handler.handlers:
+        found = None
+        # Backtrack points: (node, index, next branch to try at that node,
+        # value the parameter branch overwrote)
+        stack = []
+        # Bound once so the loop body does no attribute lookups on the stack
+        push = stack.append
+        pop = stack.pop
+        node, index, branch = self.root, 0, STATIC
+
+        while True:
+            if index == count:
+                # We've consumed all path segments
+                if node.is_endpoint:
+                    found = node
+                    break
+                # A trailing wildcard may also capture zero segments: /files/
+                wildcard = node.wildcard_child
+                if wildcard is not None and wildcard.is_endpoint:
+                    params[node.wildcard_name] = ''
+                    found = wildcard
+                    break
+            else:
+                if branch == STATIC:
+                    child = node.static_children.get(segments[index])
+                    if child is not None:
+                        push((node, index, PARAM, _UNSET))
+                        node, index = child, index + 1
+                        continue
+                    branch = PARAM
+
+                if branch == PARAM:
+                    if node.param_child is not None:
+                        # A param node keeps the first route's name, so two
+                        # levels can share a key: remember what this one
+                        # overwrote and put it back on backtrack
+                        name = node.param_name
+                        push((node, index, WILDCARD, params.get(name, _UNSET)))
+                        params[name] = segments[index]
+                        node, index, branch = node.param_child, index + 1, STATIC
+                        continue
+                    branch = WILDCARD
+
+                # Wildcard should lead to an endpoint (end of pattern)
+                wildcard = node.wildcard_child
+                if wildcard is not None and wildcard.is_endpoint:
+                    # Wildcard captures all remaining segments
+                    params[node.wildcard_name] = '/'.join(segments[index:])
+                    found = wildcard
+                    break
+
+            # Dead end: resume the next untried branch of the closest ancestor
+            if not stack:
+                break
+            node, index, branch, prev = pop()
+            if branch == WILDCARD:
+                # Coming back from the parameter branch, undo its value
+                if prev is _UNSET:
+                    del params[node.param_name]
+                else:
+                    params[node.param_name] = prev
+
+        if found and method in found.handlers:
             return RouteMatch(
-                handler=handler.handlers[method],
-                path_params=params.copy(),
-                route_pattern=handler.route_pattern
+                handler=found.handlers[method],
+                path_params=params,
+                route_pattern=found.route_pattern
             )
 
         return None
@@ -129,18 +217,6 @@ class RouteTrie:
             return []
         return clean_pattern.split('/')
 
-    def _parse_path(self, path: str) -> List[str]:
-        """
-        Parse a request path into segments.
-
-        "/api/users/123" -> ["api", "users", "123"]
-        """
-        # Same logic as pattern parsing
-        clean_path = path.strip('/')
-        if not clean_path:
-            return []
-        return clean_path.split('/')
-
     def _get_or_create_child(self, node: TrieNode, segment: str) -> TrieNode:
         """
         Get or create the appropriate child node for a pattern segment.
@@ -166,70 +242,11 @@ class RouteTrie:
                 return node.param_child
         else:
             # Static segment like "api" or "users"
+            segment = sys.intern(segment)
             if segment not in node.static_children:
                 node.static_children[segment] = TrieNode()
             return node.static_children[segment]
 
-    def _match_recursive(self, node: TrieNode, segments: List[str],
-                        index: int, params: Dict[str, str]) -> Optional[TrieNode]:
-        """
-        Recursively match path segments against the trie.
-
-        Uses backtracking to try different node types in priority order:
-        1. Static children (highest priority - exact matches)
-        2. Parameter children (medium priority - extract value)
-        3. Wildcard children (lowest priority - catch remaining)
-        """
-        # Base case: we've consumed all path segments
-        if index >= len(segments):
-            return node if node.is_endpoint else None
-
-        current_segment = segments[index]
-
-        # Try 1: Static match (highest priority)
-        if current_segment in node.static_children:
-            result = self._match_recursive(
-                node.static_children[current_segment],
-                segments,
-                index + 1,
-                params
-            )
-            if result:
-                return result
-
-        # Try 2: Parameter match (medium priority)
-        if node.param_child is not None:
-            # Save current params state for backtracking
-            old_params = params.copy()
-            # Extract the parameter value
-            params[node.param_name] = current_segment
-
-            result = self._match_recursive(
-                node.param_child,
-                segments,
-                index + 1,
-                params
-            )
-            if result:
-                return result
-
-            # Backtrack: restore params if this path didn't work
-            params.clear()
-            params.update(old_params)
-
-        # Try 3: Wildcard match (lowest priority, matches everything remaining)
-        if node.wildcard_child is not None:
-            # Wildcard captures all remaining segments
-            remaining_path = '/'.join(segments[index:])
-            params[node.wildcard_name] = remaining_path
-
-            # Wildcard should lead to an endpoint (end of pattern)
-            if node.wildcard_child.is_endpoint:
-                return node.wildcard_child
-
-        # No match found
-        return None
-
 
 class HTTPRouter:
     """
@@ -5,8 +5,12 @@ Thread safe:
     - while printing to console
     - while writing to file
 """
+import os
+import sys
+import time
+import atexit
+from queue import Queue, Empty, Full
 from threading import Thread, Lock
-from filelock import FileLock
 from abc import ABC, abstractmethod
 
 class LogAppender(ABC):
@@ -15,33 +19,186 @@ class LogAppender(ABC):
     def append(self, formatted_msg: str):
         pass 
 
+    def append_many(self, formatted_msgs: list):
+        # a whole batch from the logger, override when it can go out in one write
+        for formatted_msg in formatted_msgs:
+            self.append(formatted_msg)
 
-class ConsoleAppender(LogAppender):
+    def flush(self):
+        # push out anything the appender still holds, nothing by default
+        pass
+
+
+class AsyncAppender(LogAppender):
+    """
+    Producer-Consumer: append() only puts the line on a bounded queue,
+    a single daemon writer thread drains it into _sink().
+    A full queue blocks the caller until the writer catches up (backpressure).
+    After close() appending raises ValueError, like writing to a closed file.
+    """
+
+    MAX_PENDING = 10000
+    IDLE_TIMEOUT = 0.1 # seconds the writer waits for a line before _on_idle()
+    WRITE_RETRIES = 3 # extra attempts for a batch _sink() raised on
+    RETRY_DELAY = 0.05 # seconds before the first retry, doubled after each
+
+    _STOP = object()
 
     def __init__(self):
-        self.lock = Lock()
-    
+        self.q = Queue(maxsize=self.MAX_PENDING)
+        self._stopped = False
+        self._writer = Thread(target=self._drain, daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
     def append(self, formatted_msg: str):
-        with self.lock:
-            print(formatted_msg)
+        self._put(formatted_msg)
+
+    def append_many(self, formatted_msgs: list):
+        # one queue item and one write for the batch, _sink adds the last "\n"
+        if formatted_msgs:
+            self._put("\n".join(formatted_msgs))
+
+    def _put(self, item):
+        # once the writer is gone nothing drains the queue, so a full one
+        # would block forever; the timeout re-checks for a close() meanwhile
+        while True:
+            if self._stopped:
+                raise ValueError("append to a closed appender")
+            try:
+                self.q.put(item, timeout=self.IDLE_TIMEOUT)
+                return
+            except Full:
+                pass
+
+    def _drain(self):
+        while True:
+            try:
+                msg = self.q.get(timeout=self.IDLE_TIMEOUT)
+            except Empty:
+                self._on_idle()
+                continue
+            if msg is self._STOP:
+                self.q.task_done()
+                break
+            self._write(msg)
+            self.q.task_done()
+        self._on_idle()
+
+    def _write(self, msg: str):
+        # retried right here before the next item, so batches stay in order
+        # and close() / flush() still wait for them
+        delay = self.RETRY_DELAY
+        for attempt in range(self.WRITE_RETRIES + 1):
+            try:
+                self._sink(msg)
+                return
+            except Exception as exp:
+                if attempt == self.WRITE_RETRIES:
+                    # keep the writer alive, a dead writer would block every caller
+                    print(f"Unable to write log due to {exp}", file=sys.stderr)
+                    return
+            time.sleep(delay)
+            delay *= 2
+
+    @abstractmethod
+    def _sink(self, formatted_msg: str):
+        # runs on the writer thread only
+        pass
+
+    def _on_idle(self):
+        pass
 
-class FileAppender(LogAppender):
+    def flush(self):
+        # waits for the writer to take everything queued so far, then
+        # pushes it out; not for the writer thread itself
+        if self._writer.is_alive():
+            self.q.join()
+        self._on_idle()
 
-    def __init__(self, file_name: str):
+    def close(self):
+        # writes out everything queued so far, then stops the writer
+        self._stopped = True
+        if self._writer.is_alive():
+            self.q.put(self._STOP)
+            self._writer.join()
+
+
+class ConsoleAppender(AsyncAppender):
+
+    def __init__(self):
+        self._stdout_write = sys.stdout.write
+        super().__init__()
+    
+    def _sink(self, formatted_msg: str):
+        # only the writer thread prints, so no lock
+        # plain writes, print() would build a tuple and join with sep/end
+        self._stdout_write(formatted_msg)
+        self._stdout_write("\n")
+
+    def _on_idle(self):
+        # once the writer has caught up, not per line
+        sys.stdout.flush()
+
+class FileAppender(AsyncAppender):
+    """
+    Keeps the file open and buffers writes in memory, the writer thread
+    flushes the buffer every FLUSH_INTERVAL seconds and whenever it goes idle.
+    sync=True flushes and fsyncs every line instead (crash durability).
+    cross_process=True guards writes with a FileLock so several processes
+    can share the file, each line is flushed while the file lock is held.
+    """
+
+    FLUSH_INTERVAL = 0.1 # seconds
+
+    def __init__(self, file_name: str, sync: bool = False, cross_process: bool = False):
         self.file_name = file_name 
-        self.lock_file = f"{self.file_name}.lock"
-        self.lock = FileLock(self.lock_file)
+        self.cross_process = cross_process
+        if cross_process:
+            # syscall per acquire, only worth it when other processes write too
+            from filelock import FileLock
+            self.lock_file = f"{self.file_name}.lock"
+            self.lock = FileLock(self.lock_file)
+        else:
+            # uncontended: only the writer thread and flush()/close() take it
+            self.lock = Lock()
+        self.sync = sync
+        # binary mode, lines are encoded once in _sink, skips the TextIOWrapper layer
+        self._fp = open(self.file_name, 'ab', buffering=65536)
+        self._closed = False
+        self._last_flush = time.monotonic()
+        super().__init__()
     
-    def append(self, formatted_msg: str):
+    def _sink(self, formatted_msg: str):
+
+        with self.lock:
+            self._fp.write(formatted_msg.encode('utf-8', errors='replace') + b"\n")
+            if self.sync or self.cross_process:
+                # another process must not see half a buffered line
+                self._fp.flush()
+            if self.sync:
+                os.fsync(self._fp.fileno()) # survives a crash, at a syscall per line
+            elif time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL:
+                self._fp.flush()
+                self._last_flush = time.monotonic()
+
+    def _on_idle(self):
+        with self.lock:
+            if not self._closed:
+                self._fp.flush()
+                self._last_flush = time.monotonic()
 
+    def close(self):
+        super().close()
         with self.lock:
-            with open(self.file_name, 'a', encoding='utf-8') as fp:
-                fp.write(formatted_msg+"\n")
-                fp.flush() # immediately writes the data to the file
+            if not self._closed:
+                self._closed = True
+                self._fp.close()
 
 if __name__ == "__main__":
     ca = ConsoleAppender()
     ca.append("[29-08-25 20:0535] [Thread-33852] [INFO] Application started")
 
     fa = FileAppender("test.txt")
-    fa.append("[29-08-25 20:0535] [Thread-33852] [INFO] Application started")
\ No newline at end of file
+    fa.append("[29-08-25 20:0535] [Thread-33852] [INFO] Application started")
+    fa.close()
\ No newline at end of file
@@ -10,8 +10,9 @@ This implementation covers:
 4. Basic batching mechanism
 """
 
+import os
 import threading
-import queue
+import collections
 import time
 import json
 from abc import ABC, abstractmethod
@@ -20,6 +21,12 @@ from typing import List, Dict, Any
 from datetime import datetime
 import sys
 
+try:
+    # Rust JSON encoder, several times faster than json.dumps; optional
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class LogLevel(Enum):
     """Log levels with priority ordering"""
@@ -31,17 +38,73 @@ class LogLevel(Enum):
     FATAL = 5
 
 
+# Level names indexed by level value (values run 0..5 in order), a tuple
+# index instead of the Enum.name descriptor per formatted record
+LEVEL_NAMES = tuple(level.name for level in LogLevel)
+# Same indexing for the members themselves, the hot path carries plain ints
+LEVELS = tuple(LogLevel)
+
+
 class LogMessage:
     """Represents a single log message"""
-    def __init__(self, level: LogLevel, message: str, timestamp: float = None, 
+    
+    __slots__ = ('level', 'level_value', 'message', 'timestamp', 'thread_id', 'metadata')
+    
+    def __init__(self, level: LogLevel, message: str, timestamp: int = None, 
                  thread_id: int = None, metadata: Dict = None):
+        self.reset(level, message, timestamp, thread_id, metadata)
+    
+    def reset(self, level: LogLevel, message: str, timestamp: int = None, 
+              thread_id: int = None, metadata: Dict = None, level_value: int = None):
+        """(Re)fill every field, lets pooled instances be reused"""
         self.level = level
+        # Enum.value is a descriptor call, callers that know the int pass it
+        self.level_value = level.value if level_value is None else level_value
         self.message = message
-        self.timestamp = timestamp or time.time()
+        self.timestamp = timestamp or time.time_ns()  # epoch nanoseconds
         self.thread_id = thread_id or threading.get_ident()
         self.metadata = metadata or {}
 
 
+class _LogMsgPool:
+    """
+    Free list of LogMessage objects, so steady-state logging reuses
+    instances instead of allocating one per record. Producers acquire,
+    the consumer releases after a batch is written. deque append/pop are
+    atomic under the GIL, so no lock is needed.
+    """
+    
+    def __init__(self, size: int):
+        self.size = size
+        self._free = collections.deque(LogMessage.__new__(LogMessage) for _ in range(size))
+    
+    def acquire(self) -> LogMessage:
+        try:
+            return self._free.pop()
+        except IndexError:
+            # Pool exhausted: grow, the extra instance is kept on release
+            # only while the pool is below its size
+            return LogMessage.__new__(LogMessage)
+    
+    def release(self, log_message: LogMessage):
+        if len(self._free) < self.size:
+            self._free.append(log_message)
+
+
+class _ProducerRing:
+    """One producer thread's buffer, as the consumer sees it"""
+    
+    __slots__ = ('thread', 'messages', 'dropped', 'reported')
+    
+    def __init__(self, thread: threading.Thread):
+        self.thread = thread
+        self.messages = collections.deque()
+        # Messages dropped on a full ring; only the producer writes dropped,
+        # only the consumer writes reported, so neither needs a lock
+        self.dropped = 0
+        self.reported = 0
+
+
 # STRATEGY PATTERN: Different formatters
 class LogFormatter(ABC):
     """Abstract base class for log formatters"""
@@ -54,23 +117,97 @@ class LogFormatter(ABC):
 class PlainTextFormatter(LogFormatter):
     """Plain text log formatter"""
     
+    def __init__(self):
+        # The template is fixed once the formatter exists, so format() is
+        # built once as a closure: per record it reads only locals and cells,
+        # no attribute lookups on self and no globals
+        self.format = self._build_format()
+    
     def format(self, log_message: LogMessage) -> str:
-        dt = datetime.fromtimestamp(log_message.timestamp)
-        return f"[{dt.isoformat()}] [{log_message.level.name}] [Thread-{log_message.thread_id}] {log_message.message}"
+        # Shadowed per instance in __init__, kept for the LogFormatter interface
+        return self.format(log_message)
+    
+    @staticmethod
+    def _build_format():
+        fromtimestamp = datetime.fromtimestamp
+        names = LEVEL_NAMES
+        # isoformat() of the last whole second seen; records in the same
+        # second only format their microseconds
+        cached_second = None
+        cached_iso = ""
+        
+        def format(log_message: LogMessage) -> str:
+            nonlocal cached_second, cached_iso
+            # Integer split of the nanosecond timestamp, microseconds truncated
+            second, nanos = divmod(log_message.timestamp, 1_000_000_000)
+            micros = nanos // 1000
+            if second != cached_second:
+                cached_iso = fromtimestamp(second).isoformat()
+                cached_second = second
+            stamp = f"{cached_iso}.{micros:06d}" if micros else cached_iso
+            return f"[{stamp}] [{names[log_message.level_value]}] [Thread-{log_message.thread_id}] {log_message.message}"
+        
+        return format
 
 
 class JSONFormatter(LogFormatter):
     """JSON log formatter"""
     
+    def __init__(self):
+        # Specialized once for the encoder available, like PlainTextFormatter
+        self.format = self._build_format()
+    
     def format(self, log_message: LogMessage) -> str:
-        log_dict = {
-            'timestamp': log_message.timestamp,
-            'level': log_message.level.name,
-            'thread_id': log_message.thread_id,
-            'message': log_message.message,
-            'metadata': log_message.metadata
-        }
-        return json.dumps(log_dict)
+        # Shadowed per instance in __init__, kept for the LogFormatter interface
+        return self.format(log_message)
+    
+    @staticmethod
+    def _build_format():
+        names = LEVEL_NAMES
+        dumps = json.dumps
+        
+        def as_dict(log_message: LogMessage) -> Dict[str, Any]:
+            return {
+                'timestamp': log_message.timestamp / 1e9,  # seconds, as before
+                'level': names[log_message.level_value],
+                'thread_id': log_message.thread_id,
+                'message': log_message.message,
+                'metadata': log_message.metadata
+            }
+        
+        if orjson is not None:
+            orjson_dumps = orjson.dumps
+            option = orjson.OPT_NON_STR_KEYS
+            
+            def format(log_message: LogMessage) -> str:
+                log_dict = as_dict(log_message)
+                try:
+                    # Appenders take str, decoding the bytes is a single cheap copy
+                    return orjson_dumps(log_dict, option=option).decode()
+                except TypeError:
+                    # Metadata orjson can't encode, let json.dumps try (and report it)
+                    return dumps(log_dict)
+            
+            return format
+        
+        quote = json.encoder.encode_basestring_ascii
+        quoted_names = tuple(quote(name) for name in names)
+        
+        def format(log_message: LogMessage) -> str:
+            message = log_message.message
+            if log_message.metadata or type(message) is not str:
+                return dumps(as_dict(log_message))
+            # Common case, no metadata: build the same text json.dumps
+            # would, escaping only the message
+            return (f'{{"timestamp": {log_message.timestamp / 1e9!r}, "level": {quoted_names[log_message.level_value]}, '
+                    f'"thread_id": {log_message.thread_id!r}, "message": {quote(message)}, "metadata": {{}}}}')
+        
+        return format
+
+
+# File data only, skips the metadata write fsync also does; macOS and
+# Windows have no fdatasync
+_fdatasync = getattr(os, 'fdatasync', os.fsync)
 
 
 # OBSERVER PATTERN: Multiple appenders
@@ -80,31 +217,144 @@ class LogAppender(ABC):
     @abstractmethod
     def append(self, formatted_message: str):
         pass
+    
+    def append_batch(self, formatted_messages: List[str]):
+        """Write a whole batch, appenders that can do one write override this"""
+        for formatted_message in formatted_messages:
+            self.append(formatted_message)
+    
+    def flush(self):
+        """Called once after every batch"""
+        pass
+    
+    def close(self):
+        """Called once on logger shutdown"""
+        self.flush()
 
 
 class ConsoleAppender(LogAppender):
     """Writes logs to console"""
     
-    def __init__(self):
+    def append(self, formatted_message: str):
+        # Only the consumer thread writes, so no lock; and plain writes,
+        # print() would build a tuple and join it with sep/end
+        out = sys.stdout
+        out.write(formatted_message)
+        out.write('\n')
+    
+    def flush(self):
+        sys.stdout.flush()
+
+
+class FileAppender(LogAppender):
+    """
+    Writes logs to file
+    
+    The file stays open and each batch is encoded and written with one
+    write() into a large buffer. flush_every / flush_interval set how often
+    the buffer reaches the OS: every N batches, or once that many seconds
+    have passed since the last flush, whichever comes first. With
+    sync=True each of those flushes also fdatasync()s, so durability is
+    paid for on that schedule and not per record. close() always does both.
+    """
+    
+    def __init__(self, filename: str, flush_every: int = 1, flush_interval: float = None,
+                 sync: bool = False):
+        self.filename = filename
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.sync = sync
         self._lock = threading.Lock()
+        self._fh = open(filename, 'ab', buffering=1024 * 1024)
+        self._pending_batches = 0
+        self._last_flush = time.monotonic()
     
     def append(self, formatted_message: str):
+        self.append_batch([formatted_message])
+    
+    def append_batch(self, formatted_messages: List[str]):
+        data = ('\n'.join(formatted_messages) + '\n').encode('utf-8', errors='replace')
+        with self._lock:
+            self._fh.write(data)
+    
+    def flush(self):
+        self._pending_batches += 1
+        due = self._pending_batches >= self.flush_every or (
+            self.flush_interval is not None and
+            time.monotonic() - self._last_flush >= self.flush_interval)
+        if due:
+            self._flush_file(self.sync)
+    
+    def _flush_file(self, sync: bool):
         with self._lock:
-            print(formatted_message)
+            if not self._fh.closed:
+                self._fh.flush()
+                if sync:
+                    _fdatasync(self._fh.fileno())
+        self._pending_batches = 0
+        self._last_flush = time.monotonic()
+    
+    def close(self):
+        self._flush_file(True)
+        with self._lock:
+            self._fh.close()
 
 
-class FileAppender(LogAppender):
-    """Writes logs to file"""
+class VectoredFileAppender(LogAppender):
+    """
+    Writes logs to file with one vectored write per batch
+    
+    Unbuffered: append_batch() hands every encoded line to a single
+    os.writev(), so a batch reaches the kernel in one syscall, without
+    first being copied into a joined buffer or a 1 MiB userspace buffer.
+    """
+    
+    # os.writev takes at most IOV_MAX buffers per call
+    try:
+        IOV_MAX = os.sysconf('SC_IOV_MAX')
+    except (AttributeError, ValueError, OSError):
+        IOV_MAX = 1024
+    
+    # Below this many bytes per batch a joined os.write() measured faster
+    # than os.writev() (crossover around 256 lines of 200 bytes)
+    WRITEV_MIN_BYTES = 64 * 1024
     
     def __init__(self, filename: str):
         self.filename = filename
         self._lock = threading.Lock()
+        self._fd = os.open(filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
     
     def append(self, formatted_message: str):
+        self.append_batch([formatted_message])
+    
+    def append_batch(self, formatted_messages: List[str]):
+        lines = [(formatted_message + '\n').encode('utf-8', errors='replace')
+                 for formatted_message in formatted_messages]
         with self._lock:
-            with open(self.filename, 'a', encoding='utf-8') as f:
-                f.write(formatted_message + '\n')
-                f.flush()  # Ensure immediate write
+            for start in range(0, len(lines), self.IOV_MAX):
+                self._write_all(lines[start:start + self.IOV_MAX])
+    
+    def _write_all(self, lines: List[bytes]):
+        size = sum(map(len, lines))
+        if size < self.WRITEV_MIN_BYTES or not hasattr(os, 'writev'):
+            # Small batch (or no writev, Windows): joining a few short lines
+            # and one plain write() is cheaper than building the iovec array
+            data = b''.join(lines)
+        else:
+            written = os.writev(self._fd, lines)
+            if written == size:
+                return
+            # Short write (disk full, signal): finish the rest by hand
+            data = b''.join(lines)[written:]
+        while data:
+            data = data[os.write(self._fd, data):]
+    
+    def close(self):
+        with self._lock:
+            if self._fd is not None:
+                _fdatasync(self._fd)
+                os.close(self._fd)
+                self._fd = None
 
 
 # FACTORY PATTERN: Create different loggers
@@ -135,21 +385,40 @@ class Logger:
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:  # Double-checked locking
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
+                    # Fully set up before it is published: no other thread
+                    # can get a half-initialized instance or initialize twice
+                    instance = super().__new__(cls)
+                    instance._setup()
+                    instance._initialized = True
+                    cls._instance = instance
         return cls._instance
     
     def __init__(self):
-        if self._initialized:
-            return
-        
-        self._initialized = True
+        # Everything happens once, in __new__; Logger() after that is just
+        # the _instance read
+        pass
+    
+    def _setup(self):
         self.min_level = LogLevel.INFO
+        self._min_level_value = LogLevel.INFO.value  # read by every public log call
         self.formatter = PlainTextFormatter()
         self.appenders: List[LogAppender] = []
+        # Bound methods the consumer calls per batch, rebuilt by the setters;
+        # replacing the tuple is atomic, so the consumer never sees a half update
+        self._format_fn = self.formatter.format
+        self._appender_fns = ()
         
         # Producer-Consumer setup for async logging
-        self.log_queue = queue.Queue(maxsize=10000)  # Bounded queue for backpressure
+        # Every producer thread gets its own deque (single producer, single
+        # consumer): append/popleft are atomic under the GIL, so producers
+        # never contend on a shared lock. The consumer polls all of them.
+        self._tls = threading.local()
+        self._rings: List[_ProducerRing] = []
+        self._rings_lock = threading.Lock()  # only taken when a thread logs for the first time
+        self._cap = 4096  # Bounded per-thread buffer for backpressure
+        self.poll_interval = 0.005  # seconds the consumer sleeps when every ring is empty
+        self._pool = _LogMsgPool(self._cap)
+        self._dropped = 0  # drops collected from the rings, not yet logged; consumer only
         self.batch_size = 100
         self.batch_timeout = 5.0  # seconds
         self.shutdown_event = threading.Event()
@@ -170,111 +439,244 @@ class Logger:
     def set_level(self, level: LogLevel) -> 'Logger':
         """Set minimum log level"""
         self.min_level = level
+        self._min_level_value = level.value
         return self
     
     def set_formatter(self, formatter: LogFormatter) -> 'Logger':
         """Set log formatter"""
         self.formatter = formatter
+        self._format_fn = formatter.format
         return self
     
     def add_appender(self, appender: LogAppender) -> 'Logger':
         """Add log appender (Observer pattern)"""
         self.appenders.append(appender)
+        self._appender_fns = tuple((a.append_batch, a.flush) for a in self.appenders)
         return self
     
     def _should_log(self, level: LogLevel) -> bool:
         """Check if message should be logged based on level"""
-        return level.value >= self.min_level.value
-    
-    def _log(self, level: LogLevel, message: str, metadata: Dict = None):
-        """Internal logging method"""
-        if not self._should_log(level):
+        return level.value >= self._min_level_value
+    
+    def _log(self, level_value: int, message: str, metadata: Dict = None,
+             _time=time.time_ns, _get_ident=threading.get_ident, _levels=LEVELS):
+        """Internal logging method, callers have already checked the level"""
+        # _time/_get_ident/_levels are bound once as defaults: fast local
+        # loads per call. The level arrives as its int so no enum attribute
+        # is touched on the way in
+        ring = getattr(self._tls, 'ring', None)
+        if ring is None:
+            ring = self._register_ring()
+        if len(ring) >= self._cap:
+            # Backpressure: never block the producer, drop the message and
+            # count it, the consumer reports the count in the log itself
+            self._tls.producer.dropped += 1
             return
         
-        log_message = LogMessage(level, message, metadata=metadata)
-        
+        log_message = self._pool.acquire()
+        log_message.reset(_levels[level_value], message, _time(), _get_ident(), metadata, level_value)
+        ring.append(log_message)
+    
+    def _log_fmt(self, level_value: int, template: str, args: tuple,
+                 _time=time.time_ns, _get_ident=threading.get_ident):
+        """Like _log, but queues the raw (template, args) and no LogMessage"""
+        ring = getattr(self._tls, 'ring', None)
+        if ring is None:
+            ring = self._register_ring()
+        if len(ring) >= self._cap:
+            self._tls.producer.dropped += 1
+            return
+        # A plain tuple is the cheapest record to build; template % args
+        # runs later on the consumer, see _expand
+        ring.append((level_value, template, args, _time(), _get_ident()))
+    
+    def _expand(self, record: tuple) -> LogMessage:
+        """Turn a _log_fmt record into a LogMessage, on the consumer"""
+        level_value, template, args, timestamp, thread_id = record
         try:
-            # Non-blocking put with timeout
-            self.log_queue.put(log_message, timeout=0.1)
-        except queue.Full:
-            # Handle backpressure: could drop, block, or use circuit breaker
-            # For now, we'll drop the message (fail-fast)
-            self._handle_queue_full(log_message)
-    
-    def _handle_queue_full(self, log_message: LogMessage):
-        """Handle queue full scenario - this is a key design decision"""
-        # Strategy 1: Drop the message (current implementation)
-        print(f"WARNING: Log queue full, dropping message: {log_message.message}", file=sys.stderr)
-        
-        # Strategy 2: Block and wait (could use log_queue.put(log_message) without timeout)
-        # Strategy 3: Implement circuit breaker pattern
+            message = template % args if args else template
+        except (TypeError, ValueError, KeyError) as e:
+            # A bad template must not take the rest of the batch with it
+            message = f"{template} {args!r} (format error: {e})"
+        log_message = self._pool.acquire()
+        log_message.reset(LEVELS[level_value], message, timestamp, thread_id, None, level_value)
+        return log_message
+    
+    def _register_ring(self) -> collections.deque:
+        """Create the calling thread's buffer and hand it to the consumer"""
+        producer = _ProducerRing(threading.current_thread())
+        self._tls.producer = producer
+        self._tls.ring = producer.messages
+        with self._rings_lock:
+            self._rings.append(producer)
+        return producer.messages
+    
+    def _drain_rings(self, batch: List[LogMessage]):
+        """Move everything buffered by every producer into batch"""
+        with self._rings_lock:
+            rings = list(self._rings)
+        finished = []
+        for producer in rings:
+            ring = producer.messages
+            popleft = ring.popleft
+            while True:
+                try:
+                    batch.append(popleft())
+                except IndexError:
+                    break
+            dropped = producer.dropped
+            if dropped != producer.reported:
+                self._dropped += dropped - producer.reported
+                producer.reported = dropped
+            # An exited thread can't append again, forget its ring once empty
+            if not producer.thread.is_alive() and not ring:
+                finished.append(producer)
+        if finished:
+            with self._rings_lock:
+                for producer in finished:
+                    self._rings.remove(producer)
     
     def _consume_logs(self):
         """Consumer thread that processes logs in batches"""
         batch = []
-        last_flush_time = time.time()
+        last_flush_time = time.monotonic()
         
         while not self.shutdown_event.is_set():
             try:
-                # Try to get a message with timeout
-                try:
-                    log_message = self.log_queue.get(timeout=1.0)
-                    batch.append(log_message)
-                except queue.Empty:
-                    # Timeout occurred, check if we should flush
-                    pass
+                # Round-robin over the producer rings, sleep briefly only
+                # when none of them had anything
+                pending = len(batch)
+                self._drain_rings(batch)
+                if len(batch) == pending:
+                    self.shutdown_event.wait(self.poll_interval)
                 
                 # Check flush conditions
                 should_flush = (
                     len(batch) >= self.batch_size or  # Size-based flush
-                    (batch and time.time() - last_flush_time >= self.batch_timeout)  # Time-based flush
+                    (batch and time.monotonic() - last_flush_time >= self.batch_timeout)  # Time-based flush
                 )
                 
                 if should_flush:
-                    self._flush_batch(batch)
-                    batch = []
-                    last_flush_time = time.time()
+                    try:
+                        self._flush_batch(batch)
+                    finally:
+                        # Even if the flush failed: its messages may already
+                        # be back in the pool and must not be flushed again
+                        batch = []
+                        last_flush_time = time.monotonic()
                     
             except Exception as e:
                 print(f"Error in log consumer: {e}", file=sys.stderr)
         
-        # Flush remaining logs on shutdown
-        if batch:
+        # Flush remaining logs on shutdown, including any still buffered
+        self._drain_rings(batch)
+        if batch or self._dropped:
             self._flush_batch(batch)
     
     def _flush_batch(self, batch: List[LogMessage]):
         """Flush a batch of log messages to all appenders"""
+        if self._dropped:
+            # One synthetic record per batch instead of a stderr line per drop
+            batch.insert(0, LogMessage(LogLevel.WARN, f"Log buffer full, dropped {self._dropped} messages"))
+            self._dropped = 0
         if not batch:
             return
         
+        # Format once, then hand the whole batch to each appender. A record
+        # that can't be formatted (or expanded, for the raw tuples the
+        # *_fmt() methods queue) is reported and skipped, not the batch
+        format_message = self._format_fn
+        formatted_messages = []
+        pooled = []
         for log_message in batch:
-            formatted_message = self.formatter.format(log_message)
-            
+            try:
+                if type(log_message) is tuple:
+                    log_message = self._expand(log_message)
+                pooled.append(log_message)
+                formatted_messages.append(format_message(log_message))
+            except Exception as e:
+                print(f"Error formatting log: {e}", file=sys.stderr)
+        
+        try:
             # Send to all appenders (Observer pattern)
-            for appender in self.appenders:
+            for append_batch, flush in self._appender_fns:
                 try:
-                    appender.append(formatted_message)
+                    append_batch(formatted_messages)
+                    flush()
                 except Exception as e:
                     print(f"Error in appender: {e}", file=sys.stderr)
+        finally:
+            # Only the strings are needed now; every message goes back to
+            # the pool exactly once
+            release = self._pool.release
+            for log_message in pooled:
+                release(log_message)
     
     # Public logging methods
+    # The level gate is inlined so a disabled call costs one attribute read
+    # and one int compare, before any LogMessage is built
     def trace(self, message: str, metadata: Dict = None):
-        self._log(LogLevel.TRACE, message, metadata)
+        if self._min_level_value > 0:
+            return
+        self._log(0, message, metadata)  # LogLevel.TRACE
     
     def debug(self, message: str, metadata: Dict = None):
-        self._log(LogLevel.DEBUG, message, metadata)
+        if self._min_level_value > 1:
+            return
+        self._log(1, message, metadata)  # LogLevel.DEBUG
     
     def info(self, message: str, metadata: Dict = None):
-        self._log(LogLevel.INFO, message, metadata)
+        if self._min_level_value > 2:
+            return
+        self._log(2, message, metadata)  # LogLevel.INFO
     
     def warn(self, message: str, metadata: Dict = None):
-        self._log(LogLevel.WARN, message, metadata)
+        if self._min_level_value > 3:
+            return
+        self._log(3, message, metadata)  # LogLevel.WARN
     
     def error(self, message: str, metadata: Dict = None):
-        self._log(LogLevel.ERROR, message, metadata)
+        if self._min_level_value > 4:
+            return
+        self._log(4, message, metadata)  # LogLevel.ERROR
     
     def fatal(self, message: str, metadata: Dict = None):
-        self._log(LogLevel.FATAL, message, metadata)
+        if self._min_level_value > 5:
+            return
+        self._log(5, message, metadata)  # LogLevel.FATAL
+    
+    # Deferred-format variants: logger.info_fmt("user %s took %.1fms", user, ms)
+    # queues the template and args as-is, the string is only built by the
+    # consumer thread
+    def trace_fmt(self, template: str, *args):
+        if self._min_level_value > 0:
+            return
+        self._log_fmt(0, template, args)  # LogLevel.TRACE
+    
+    def debug_fmt(self, template: str, *args):
+        if self._min_level_value > 1:
+            return
+        self._log_fmt(1, template, args)  # LogLevel.DEBUG
+    
+    def info_fmt(self, template: str, *args):
+        if self._min_level_value > 2:
+            return
+        self._log_fmt(2, template, args)  # LogLevel.INFO
+    
+    def warn_fmt(self, template: str, *args):
+        if self._min_level_value > 3:
+            return
+        self._log_fmt(3, template, args)  # LogLevel.WARN
+    
+    def error_fmt(self, template: str, *args):
+        if self._min_level_value > 4:
+            return
+        self._log_fmt(4, template, args)  # LogLevel.ERROR
+    
+    def fatal_fmt(self, template: str, *args):
+        if self._min_level_value > 5:
+            return
+        self._log_fmt(5, template, args)  # LogLevel.FATAL
     
     def shutdown(self):
         """Graceful shutdown - flush all pending logs"""
@@ -284,6 +686,12 @@ class Logger:
         # Wait for consumer thread to finish
         if self.consumer_thread.is_alive():
             self.consumer_thread.join(timeout=10.0)
+        
+        for appender in self.appenders:
+            try:
+                appender.close()
+            except Exception as e:
+                print(f"Error in appender: {e}", file=sys.stderr)
 
 
 # Demo usage and testing
@@ -3,9 +3,10 @@ Formatters
 """
 
 import json
+import string
 from abc import ABC, abstractmethod 
-from log_message import LogMessage
-from log_level import LogLevel
+from log_message import LogMessage, format_timestamp
+from log_level import LogLevel, LEVEL_NAMES
 
 class LogFormatter(ABC):
 
@@ -13,14 +14,48 @@ class LogFormatter(ABC):
     def format(self, message: LogMessage):
         pass
 
+# template field -> expression on the message `m` in the generated format()
+TEMPLATE_FIELDS = {
+    'timestamp': '_ts(m.timestamp)',
+    'thread_id': 'm.thread_id',
+    'level': '_names[m.level_value]',
+    'message': 'm.message',
+    'metadata': 'm.metadata',
+}
+
+def compile_template(template: str):
+    """
+    "[{level}] {message}" -> def _fmt(m): return f'[{_names[m.level_value]}] {m.message}'
+    The layout is fixed once configured, so it's turned into a single
+    f-string function once instead of being interpreted per message.
+    """
+    body = ''
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        body += literal.replace('{', '{{').replace('}', '}}')
+        if field is None:
+            continue
+        if field not in TEMPLATE_FIELDS:
+            raise ValueError(f"Unknown field {{{field}}} in log template, expected one of {', '.join(TEMPLATE_FIELDS)}")
+        if '{' in spec:
+            raise ValueError(f"Nested fields aren't supported in log template: {template}")
+        body += '{' + TEMPLATE_FIELDS[field] + (f'!{conversion}' if conversion else '') + (f':{spec}' if spec else '') + '}'
+    namespace = {'_ts': format_timestamp, '_names': LEVEL_NAMES}
+    # repr() quotes the body, the expressions themselves contain no quotes
+    exec(f"def _fmt(m):\n    return f{body!r}\n", namespace)
+    return namespace['_fmt']
+
 class PlainFormatter(LogFormatter):
 
-    def __init__(self):
+    TEMPLATE = "[{timestamp}] [Thread-{thread_id}] [{level}] {message}"
+
+    def __init__(self, template: str = TEMPLATE):
         print("Initializing plain formatter")
+        self.template = template
+        self.format = compile_template(template)
 
     def format(self, message: LogMessage):
-        msg_format = f"[{message.timestamp}] [Thread-{message.thread_id}] [{message.level.name}] {message.message}"
-        return msg_format
+        # shadowed per instance in __init__ by the compiled template
+        return self.format(message)
 
 class JSONFormatter(LogFormatter):
 
@@ -28,7 +63,7 @@ class JSONFormatter(LogFormatter):
         print("Intializing JSON formatter")
 
     def format(self, message: LogMessage):
-        log = message.__dict__()
+        log = message.as_dict()
         return json.dumps(log)
 
 if __name__ == "__main__":
@@ -10,4 +10,8 @@ class LogLevel(Enum):
     INFO = 2
     WARNING = 3
     ERROR = 4 
-    FATAL = 5  # High priority
\ No newline at end of file
+    FATAL = 5  # High priority
+
+# level names indexed by level value (values run 0..5 in order),
+# a tuple index instead of the Enum.name descriptor per record
+LEVEL_NAMES = tuple(level.name for level in LogLevel)
\ No newline at end of file
@@ -1,35 +1,67 @@
 """
 Log Message Class
 """
+import time
 import threading
-from log_level import LogLevel
+from log_level import LogLevel, LEVEL_NAMES
 from datetime import datetime
 
+TIMESTAMP_FORMAT = '%d-%m-%y %H:%M%S'
+
+# module-level aliases: one global load per message instead of global + attribute
+_time = time.time_ns
+_get_ident = threading.get_ident
+
+# (whole second, formatted) of the last timestamp formatted, the format has
+# second resolution so consecutive records almost always reuse it
+_last_timestamp = (None, None)
+
+def format_timestamp(timestamp: int) -> str:
+    global _last_timestamp
+    second = timestamp // 1_000_000_000
+    cached_second, formatted = _last_timestamp
+    if second != cached_second:
+        formatted = datetime.fromtimestamp(second).strftime(TIMESTAMP_FORMAT)
+        _last_timestamp = (second, formatted)
+    return formatted
+
 class LogMessage:
 
-    def __init__(self, level: LogLevel,  message: str, timestamp: datetime = None, thread_id: int = None,
+    # fixed attribute set: no per-instance dict, attribute access by offset
+    __slots__ = ('level', 'level_value', 'message', 'timestamp', 'thread_id', 'metadata')
+
+    def __init__(self, level: LogLevel,  message: str, timestamp: int = None, thread_id: int = None,
                  metadata: dict = None):
+        self.reset(level, message, timestamp, thread_id, metadata)
+
+    def reset(self, level: LogLevel,  message: str, timestamp: int = None, thread_id: int = None,
+              metadata: dict = None, level_value: int = None):
+        # fills every field, so a pooled instance can be reused as a new message
         self.level = level
+        # Enum.value is a descriptor call, callers that know the int pass it
+        self.level_value = level.value if level_value is None else level_value
         self.message = message
-        self.timestamp = timestamp if timestamp else datetime.now().strftime('%d-%m-%y %H:%M%S')
-        self.thread_id = thread_id if thread_id else threading.get_ident()
+        # raw epoch nanoseconds (an int, no float rounding), formatting is
+        # left to whoever consumes the message
+        self.timestamp = timestamp if timestamp else _time()
+        self.thread_id = thread_id if thread_id else _get_ident()
         self.metadata = metadata if metadata else {}
     
     def __str__(self):
         string = f"""
                     Log Level: {self.level.name}
                     Message: {self.message}
-                    Timestamp: {self.timestamp}
+                    Timestamp: {format_timestamp(self.timestamp)}
                     Thread ID: {self.thread_id}
                     Metadata: {self.metadata}
         """
         return string
 
-    def __dict__(self):
+    def as_dict(self):
         log_dict = {
-            'log_level': self.level.name, 
+            'log_level': LEVEL_NAMES[self.level_value], 
             'message': self.message,
-            'timestamp': self.timestamp, 
+            'timestamp': format_timestamp(self.timestamp), 
             'thread_id': self.thread_id, 
             'metadata': self.metadata
         }
@@ -39,4 +71,4 @@ class LogMessage:
 if __name__ == "__main__":
     logm = LogMessage(LogLevel.INFO, "Hello")
     print(logm.__str__())
-    print(logm.__dict__())
\ No newline at end of file
+    print(logm.as_dict())
\ No newline at end of file
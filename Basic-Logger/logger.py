@@ -2,154 +2,327 @@
 Thread Safe Efficient Logger Class
 """
 
+import sys
 import time
 import threading
-from queue import Queue, Full, Empty
+import collections
 from log_message import LogMessage
 from log_level import LogLevel
 from threading import Thread, Lock
 from formatters import PlainFormatter
 from appenders import ConsoleAppender, FileAppender
 
-class Logger:
+# level method name -> its level, for the per-instance fast paths
+LEVEL_METHODS = (
+    ('trace', LogLevel.TRACE),
+    ('debug', LogLevel.DEBUG),
+    ('info', LogLevel.INFO),
+    ('warn', LogLevel.WARNING),
+    ('error', LogLevel.ERROR),
+    ('fatal', LogLevel.FATAL),
+)
 
-    _instance = None 
-    _lock = Lock()
 
-    def __new__(cls):
+def _disabled(msg: str, metadata: dict = None):
+    pass
+
+class Logger:
+    """
+    Use get_logger() for the shared instance, every Logger() starts its
+    own consumer thread. trace() .. fatal() are set on each instance by
+    _bind_levels(), see LEVEL_METHODS
+    """
 
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    # then initialize it 
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False # because we already initialized  
-        return cls._instance
-    
     def __init__(self):
 
-        if self._initialized:
-            print("Already one instance available!")
-            return  # if we have to initialize also no need to initialize again
-        
-        self._initialized = True
         self.min_level = LogLevel.TRACE 
+        self._min_level_int = self.min_level.value
+        self._bind_levels()
         self.formatter = PlainFormatter()
-        self.appenders = []
+        # a tuple, rebound whole by set_appender(), so the consumer can read
+        # it without a lock and never sees a half-updated list
+        self.appenders = ()
         
-        self.queue = Queue(maxsize = 1000)
+        # one deque per producer thread (single producer, single consumer):
+        # append/popleft are atomic under the GIL, so producers take no lock
+        # and never contend with each other; the consumer walks all of them.
+        # The Condition is only for waking the consumer
+        self._tls = threading.local()
+        self._all_dqs = []  # (producer thread, its deque)
+        self._dqs_lock = Lock()  # only for registering / forgetting a deque
+        self._not_empty = threading.Condition()
+        self.max_pending = 1000  # per producer thread
+        # above this many pending, producers wait (up to backpressure_timeout)
+        # for the consumer to catch up before anything gets dropped
+        self._high_water = int(self.max_pending * 0.8)
+        self._not_full = threading.Condition()
+        self.backpressure_timeout = 0.1
+        self.batch_size = 100
+        self.batch_timeout = 1.0
+        # freelist of LogMessage objects handed back after _flush, so steady
+        # logging reuses instances instead of allocating one per call
+        self._msg_pool = collections.deque(maxlen = 2048)
+        # counted rather than printed, summed up once by shutdown()
+        self._dropped = 0
+        self._consumer_errors = 0
+        self._last_consumer_error = None
+        self._format_errors = 0
+        self._last_format_error = None
+        self._append_errors = 0
+        self._last_append_error = None
 
         self.shutdown_event = threading.Event()
         self.consumer_thread = threading.Thread(target = self._consume_logs, daemon=True)
         self.consumer_thread.start()
-        self.batch_size = 100
-        self.batch_timeout = 1.0
 
         print("Logger initialized!")
 
     def set_min_level(self, min_level: LogLevel):
         self.min_level = min_level 
+        self._min_level_int = min_level.value
+        self._bind_levels()
         return self
+
+    def _bind_levels(self):
+        # min_level rarely changes, so each level method is rebuilt here as
+        # an instance attribute: a no-op below the threshold, a direct call
+        # into _log above it
+        log = self._log
+        for name, level in LEVEL_METHODS:
+            if level.value >= self._min_level_int:
+                fn = self._level_fn(log, level)
+            else:
+                fn = _disabled
+            setattr(self, name, fn)
+
+    @staticmethod
+    def _level_fn(log, level: LogLevel):
+        level_int = level.value
+        def log_at_level(msg: str, metadata: dict = None):
+            log(msg, level, level_int, metadata)
+        log_at_level.__name__ = level.name.lower()
+        return log_at_level
     
     def set_formatter(self, formatter):
         self.formatter = formatter 
         return self
     
     def set_appender(self, appender):
-        self.appenders.append(appender)
+        self.appenders = self.appenders + (appender,)
         return self
 
-    def _log(self, msg: str, log_level: LogLevel, metadata: dict = None):
+    def _log(self, msg: str, log_level: LogLevel, level_int: int, metadata: dict = None,
+             _time_ns = time.time_ns, _get_ident = threading.get_ident):
         """
-        1. Check the log level
-        2. Create log message
-        3. Format the message
-        4. Send to all appenders
+        1. Create log message (the level methods already checked the level)
+        2. Queue it for the consumer, which formats it
+        3. and sends it to all appenders
         """
-        if self._should_log(log_level):
-
-            log_message = LogMessage(log_level, msg, metadata = metadata)
-            try:
-                self.queue.put(log_message, timeout = 0.1)
-            except Full:
-                self._handle_queue_full(msg)
-
-    
-    def _should_log(self, log_level: LogLevel) -> bool:
+        # queue fullness is an int compare below, never a raised Full; same
+        # here, an empty pool (every instance queued, i.e. a burst) is a
+        # branch, the except only covers racing another producer for the last one
+        pool = self._msg_pool
+        try:
+            log_message = pool.pop() if pool else LogMessage.__new__(LogMessage)
+        except IndexError:
+            log_message = LogMessage.__new__(LogMessage)
+        # captured here, only for logs that passed the level check: integer
+        # wall-clock ns (the formatter needs wall time, so not monotonic_ns),
+        # turned into text once per second by format_timestamp
+        log_message.reset(log_level, msg, _time_ns(), _get_ident(), metadata, level_int)
+        dq = getattr(self._tls, 'dq', None)
+        if dq is None:
+            dq = self._register_thread_dq()
+        if len(dq) >= self._high_water:
+            # backpressure: slow this producer down rather than drop
+            with self._not_full:
+                self._not_full.wait_for(lambda: len(dq) < self._high_water,
+                                        timeout = self.backpressure_timeout)
+        # len check and append aren't one atomic step, concurrent
+        # producers can overshoot max_pending by a few, that's fine
+        if len(dq) >= self.max_pending:
+            self._handle_queue_full(log_message)
+            self._msg_pool.append(log_message)
+            return
+        dq.append(log_message)
+        # signal once per batch_size messages, not per message; the
+        # consumer's wait timeout picks up partial batches
+        if len(dq) == self.batch_size:
+            with self._not_empty:
+                self._not_empty.notify()
+
+    def _register_thread_dq(self):
+        dq = collections.deque()
+        self._tls.dq = dq
+        with self._dqs_lock:
+            self._all_dqs.append((threading.current_thread(), dq))
+        return dq
+
+    def _pending(self) -> int:
+        return sum(len(dq) for _, dq in self._all_dqs)
+
+    def _drain(self, batch) -> bool:
         """
-        Logs should be printed only if log_level >= min_level
+        Moves everything queued by every producer into batch, one thread
+        after another. True if some producer was over the high-water mark
         """
-        return log_level.value >= self.min_level.value
-
-    def trace(self, msg: str, metadata: dict = None):
-        self._log(msg, LogLevel.TRACE, metadata)
-
-    def debug(self, msg: str, metadata: dict = None):
-        self._log(msg, LogLevel.DEBUG, metadata)
-
-    def info(self, msg: str, metadata: dict = None):
-        self._log(msg, LogLevel.INFO, metadata) 
-    
-    def warn(self, msg: str,  metadata: dict = None):
-        self._log(msg, LogLevel.WARNING, metadata)
-
-    def error(self, msg: str, metadata: dict = None):
-        self._log(msg, LogLevel.ERROR, metadata)
-
-    def fatal(self, msg: str, metadata: dict = None):
-        self._log(msg, LogLevel.FATAL, metadata)
+        with self._dqs_lock:
+            dqs = list(self._all_dqs)
+        append = batch.append
+        congested = False
+        finished = []
+        for thread, dq in dqs:
+            # only this thread pops, so the count can't shrink under us
+            pending = len(dq)
+            congested = congested or pending >= self._high_water
+            popleft = dq.popleft
+            for _ in range(pending):
+                append(popleft())
+            # an exited thread can't log again, forget its deque once empty;
+            # liveness first: a thread can append its last message and exit
+            # between the two checks, once dead an empty deque stays empty
+            if not thread.is_alive() and not dq:
+                finished.append((thread, dq))
+        if finished:
+            with self._dqs_lock:
+                for entry in finished:
+                    self._all_dqs.remove(entry)
+        return congested
 
     def _handle_queue_full(self, log_msg: LogMessage):
-
-        print(f"WARNING: Queue is FULL, dropping this current message {log_msg.__str__()}")
+        # no print() here, it would take the stdout lock on the producer's
+        # path while the console appender may be holding it
+        self._dropped += 1
 
     def _consume_logs(self):
 
         batch = []
-        last_flush_time = time.time()
+        # monotonic: a wall-clock jump can't stall or force a flush
+        last_flush_time = time.monotonic()
         while not self.shutdown_event.is_set():
             try:
-                try:
-                    msg = self.queue.get(timeout=0.1)
-                    batch.append(msg)
-                except Empty:
-                    continue 
+                # block once per batch, producers signal at batch_size and
+                # the timeout covers partial batches
+                with self._not_empty:
+                    if self._pending() < self.batch_size:
+                        # a pending partial batch only waits out what's left of its timeout
+                        timeout = self.batch_timeout
+                        if batch:
+                            timeout = max(0.0, timeout - (time.monotonic() - last_flush_time))
+                        self._not_empty.wait(timeout=timeout)
+                # then take everything that's there in one go
+                if self._drain(batch):
+                    with self._not_full:
+                        self._not_full.notify_all()
+                if not batch:
+                    last_flush_time = time.monotonic()
+                    continue
                 
                 should_flush = (len(batch) >= self.batch_size) or \
-                    (batch and last_flush_time - time.time() >= self.batch_timeout)
+                    (time.monotonic() - last_flush_time >= self.batch_timeout)
 
                 if should_flush:
                     self._flush(batch)
                     batch = []
-                    last_flush_time = time.time()
+                    last_flush_time = time.monotonic()
 
             except Exception as exp:
-                print(f"Unable to process logs due to {exp}")
+                self._consumer_errors += 1
+                self._last_consumer_error = exp
             
-        # if still batch has some items 
+        # if still batch has some items, or messages are left in the deques
+        self._drain(batch)
         if batch:
             self._flush(batch)
 
     def _flush(self, batch):
-        try:
-            for msg in batch:
-                formatted_msg = self.formatter.format(msg)
+        # looked up once per batch, not per message; self.appenders is an
+        # immutable tuple, set_appender() on another thread rebinds it and
+        # can't change the one this batch is going to
+        fmt = self.formatter.format
+        appenders = self.appenders
+        # formatted once, then every appender gets the whole batch in one
+        # call and can write it out in one go; a message that can't be
+        # formatted is reported and skipped, not the whole batch
+        formatted_msgs = []
+        for msg in batch:
+            try:
+                formatted_msgs.append(fmt(msg))
+            except Exception as exp:
+                self._format_errors += 1
+                self._last_format_error = exp
+        # only formatted strings left the batch, the messages can be reused
+        self._msg_pool.extend(batch)
+
+        # write failures are retried by the appenders' writer threads, in
+        # order, which is where they actually happen
+        for appender in appenders:
+            self._append(appender.append_many, formatted_msgs)
 
-                for app in self.appenders:
-                    app.append(formatted_msg)
+    def _append(self, append_many, formatted_msgs):
+        try:
+            append_many(formatted_msgs)
         except Exception as exp:
-            print(f"Unable to append logs due to {exp}")
+            self._append_errors += 1
+            self._last_append_error = exp
 
     def shutdown(self):
+        # wake the consumer now instead of after its batch timeout, it
+        # drains and flushes what's queued before it exits
         self.shutdown_event.set()
+        with self._not_empty:
+            self._not_empty.notify_all()
         self.consumer_thread.join()
+        # anything logged while the consumer was finishing up
+        batch = []
+        self._drain(batch)
+        if batch:
+            self._flush(batch)
+        # and make the appenders write out what they still buffer
+        for appender in self.appenders:
+            try:
+                appender.flush()
+            except Exception as exp:
+                print(f"Unable to flush appender due to {exp}")
+        summary = ""
+        if self._dropped:
+            summary += f"Logger: queue was full, dropped {self._dropped} messages\n"
+        if self._consumer_errors:
+            summary += (f"Logger: unable to process logs {self._consumer_errors} times, "
+                        f"last due to {self._last_consumer_error}\n")
+        if self._format_errors:
+            summary += (f"Logger: unable to format {self._format_errors} messages, "
+                        f"last due to {self._last_format_error}\n")
+        if self._append_errors:
+            summary += (f"Logger: unable to append logs {self._append_errors} times, "
+                        f"last due to {self._last_append_error}\n")
+        if summary:
+            sys.stderr.write(summary)
+
+
+_logger = None
+_logger_lock = Lock()
+
+
+def get_logger() -> Logger:
+    # the one shared Logger, built on first use. _logger is only ever set
+    # once, to a fully built Logger, so a plain read is enough once it is
+    # set; the lock makes sure two first callers both get the same instance
+    global _logger
+    logger = _logger
+    if logger is None:
+        with _logger_lock:
+            if _logger is None:
+                _logger = Logger()
+            logger = _logger
+    return logger
 
 
 if __name__ == "__main__":
     pf = PlainFormatter()
     ca = ConsoleAppender()
     fa = FileAppender('test_log.log')
-    log = Logger().set_min_level(LogLevel.DEBUG).set_formatter(pf).set_appender(ca).set_appender(fa)
+    log = get_logger().set_min_level(LogLevel.DEBUG).set_formatter(pf).set_appender(ca).set_appender(fa)
 
     #print(log.min_level)
     #print(log.formatter)
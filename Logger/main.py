@@ -1,8 +1,11 @@
 import os
+import sys
+import time
+import atexit
+import collections
 from enum import Enum
 from abc import ABC
-from datetime import datetime
-from threading import Lock
+from threading import Lock, Thread, Condition
 
 
 class LogConfiguration(ABC):
@@ -29,35 +32,91 @@ class AppenderFactory:
 class Appender(ABC):
 
     def log(self, msg: str, log_level: str):
+        self._write_raw(_format(msg, log_level))
+
+    def _write_raw(self, line: str):
+        # line is already formatted, Logger formats before it queues
         raise NotImplementedError("Must be implemented by subclasses.")
 
+    def close(self):
+        pass
+
 class FileAppender(Appender):
+    """
+    Keeps the file open and queues lines in memory, a background thread
+    writes them out in one write() per batch: every FLUSH_INTERVAL seconds
+    or as soon as BATCH_SIZE lines are waiting, whichever comes first.
+    close() writes whatever is left and fsyncs the file.
+    """
+
+    FLUSH_INTERVAL = 0.05 # seconds
+    BATCH_SIZE = 256
 
     def __init__(self, config_obj: LogConfiguration):
         self.config = config_obj
-
-    def log(self, msg: str, log_level: str):
-        self.msg = LogMessage(msg, log_level).get_msg()
-        with open(self.config.filename, 'a') as fp:
-            fp.write(self.msg)
+        # opened once; unbuffered, the flusher already hands write() a whole batch
+        self.fp = open(self.config.filename, 'ab', buffering=0)
+        self._queue = collections.deque()
+        self._cv = Condition()
+        self._closed = False
+        self._flusher_thread = Thread(target=self._flusher, daemon=True)
+        self._flusher_thread.start()
+        atexit.register(self.close)
+
+    def _write_raw(self, line: str):
+        with self._cv:
+            self._queue.append(line.encode('utf-8'))
+            # a full batch goes out now, anything less waits for the interval
+            if len(self._queue) >= self.BATCH_SIZE:
+                self._cv.notify()
+
+    def _flusher(self):
+        while True:
+            with self._cv:
+                if len(self._queue) < self.BATCH_SIZE and not self._closed:
+                    self._cv.wait(timeout=self.FLUSH_INTERVAL)
+                closed = self._closed
+            self._write_pending()
+            if closed:
+                break
+
+    def _write_pending(self):
+        # only popleft()s what is there now, producers keep appending meanwhile
+        queue = self._queue
+        lines = [queue.popleft() for _ in range(len(queue))]
+        if lines:
+            self.fp.write(b''.join(lines))
+
+    def close(self):
+        with self._cv:
+            if self._closed:
+                return
+            self._closed = True
+            self._cv.notify()
+        self._flusher_thread.join()
+        # lines logged while the flusher was finishing up
+        self._write_pending()
+        os.fsync(self.fp.fileno())
+        self.fp.close()
 
 class ConsoleAppender(Appender):
 
     def __init__(self, config_obj: LogConfiguration):
         self.config = config_obj
+        self._write = sys.stdout.write
+        self._prefix = f"[{self.config.prefix}] "
 
-    def log(self, msg: str, log_level: str):
-        self.msg = LogMessage(msg, log_level).get_msg()
-        print(f"[{self.config.prefix}] {self.msg}")
+    def _write_raw(self, line: str):
+        # one write with the newline joined in, print() writes it separately
+        self._write(self._prefix + line + "\n")
 
 class DBAppender(Appender):
 
     def __init__(self, config_obj: LogConfiguration):
         self.config = config_obj
 
-    def log(self, msg: str, log_level: str):
-        self.msg = LogMessage(msg, log_level).get_msg()
-        print(f"INSERT into msg table: {self.msg}")
+    def _write_raw(self, line: str):
+        print(f"INSERT into msg table: {line}")
 
 class LogLevels(Enum):
     DEBUG = 1
@@ -66,16 +125,33 @@ class LogLevels(Enum):
     FATAL = 4
     TRACE = 5
 
+# "[INFO]" etc, built once instead of per message
+_LEVEL_TAGS = {level: f"[{level.name}]" for level in LogLevels}
+
+# (second, its timestamp text) of the last second formatted, strftime runs
+# once per second; one tuple, so a thread never sees one half updated
+_ts_cache = (0, '')
+
+def _format(msg: str, log_level: LogLevels) -> str:
+    # what the appenders call per message, no LogMessage built for it
+    global _ts_cache
+    t = int(time.time())
+    sec, now = _ts_cache
+    if t != sec:
+        now = time.strftime("%d%m%y_%H%M%S", time.localtime(t))
+        _ts_cache = (t, now)
+    return f"[{now}]{_LEVEL_TAGS[log_level]}: {msg}"
+
 class LogMessage:
 
+    __slots__ = ('msg', 'log_level')
+
     def __init__(self, msg: str, log_level: LogLevels):
         self.msg = msg
         self.log_level = log_level
 
     def get_msg(self):
-        now = datetime.now().strftime("%d%m%y_%H%M%S")
-        msg = f"[{now}][{self.log_level.name}]: {self.msg}"
-        return msg
+        return _format(self.msg, self.log_level)
 
 class ConsoleConfig(LogConfiguration):
 
@@ -111,25 +187,99 @@ class DBConfig(LogConfiguration):
         # create table if not present
         pass
 
+# 'info' -> LogLevels.INFO, one dict lookup validates and converts the level
+_LEVEL_BY_NAME = {level.name.lower(): level for level in LogLevels}
+
+# levels that get dropped instead of queued once the logger falls behind
+_DISCARDABLE = frozenset([LogLevels.TRACE, LogLevels.DEBUG, LogLevels.INFO])
+
 class Logger:
+    """
+    log() only puts the message on a bounded ring buffer, one consumer
+    thread takes the whole buffer at a time and hands the messages to the
+    appender in order, so callers never wait on the sink.
+    Past DISCARDING_THRESHOLD queued messages, trace/debug/info are dropped;
+    at QUEUE_SIZE the oldest message makes room for the new one.
+    """
+
+    QUEUE_SIZE = 10000
+    DISCARDING_THRESHOLD = int(QUEUE_SIZE * 0.8)
 
     def __init__(self, output_type: str, config_obj: LogConfiguration):
         self.output_type = output_type
         self.aobj = AppenderFactory.get_appender(output_type, config_obj)
-        self.lock = Lock()
+        self._buf = collections.deque(maxlen=self.QUEUE_SIZE)
+        # one plain lock under the condition: producers take it per message,
+        # the consumer once per batch
+        self._cv = Condition(Lock())
+        self._closed = False
+        self.dropped = 0
+        self._consumer = Thread(target=self._consume, daemon=True)
+        self._consumer.start()
+        atexit.register(self.close)
+
+    @property
+    def qsize(self):
+        # messages waiting for the consumer, for monitoring
+        return len(self._buf)
 
     def log(self, msg: str, log_level: str):
-        if log_level.lower() not in ['info', 'debug', 'warning', 'fatal', 'trace']:
-            raise Exception("Only these values are allowed \
-                for log level: info | debug | warning | fatal | trace ")
-        self.msg = msg
-        self.log_level = LogLevels[log_level.upper()]
-        with self.lock:
-            self.aobj.log(self.msg, self.log_level)
-
+        # locals only, callers on other threads would overwrite attributes
+        level = _LEVEL_BY_NAME.get(log_level)
+        if level is None:
+            # 'INFO', 'Info' are fine too, only lowered when it wasn't a hit
+            level = _LEVEL_BY_NAME.get(log_level.lower())
+            if level is None:
+                raise ValueError("Only these values are allowed \
+                    for log level: info | debug | warning | fatal | trace ")
+        # formatted before the lock, which then only covers the append;
+        # also stamps the time of the call, not of the write
+        line = _format(msg, level)
+        buf = self._buf
+        with self._cv:
+            pending = len(buf)
+            if pending > self.DISCARDING_THRESHOLD and level in _DISCARDABLE:
+                self.dropped += 1
+                return
+            if pending == self.QUEUE_SIZE:
+                # the append below pushes out the oldest
+                self.dropped += 1
+            buf.append(line)
+            # the consumer only ever sleeps on an empty buffer
+            if not pending:
+                self._cv.notify()
+
+    def _consume(self):
+        # the only thread calling the appender, so it needs no lock
+        buf = self._buf
+        while True:
+            with self._cv:
+                while not buf and not self._closed:
+                    self._cv.wait()
+                batch = list(buf)
+                buf.clear()
+            if not batch:
+                # closed, and everything before it is written
+                break
+            write_raw = self.aobj._write_raw
+            for line in batch:
+                try:
+                    write_raw(line)
+                except Exception as exp:
+                    print(f"ERROR: Unable to log message due to {exp}")
+
+    def close(self):
+        # everything logged before this is handed to the appender first
+        if self._consumer.is_alive():
+            with self._cv:
+                self._closed = True
+                self._cv.notify()
+            self._consumer.join()
+            self.aobj.close()
 
 if __name__ == "__main__":
     cs_config = ConsoleConfig()
     cs_config.setup_config()
     logger = Logger('console', cs_config)
     logger.log("Hello world!", "info")
+    logger.close()
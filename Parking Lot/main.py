@@ -9,9 +9,10 @@ The system should handle multiple entry and exit points and support concurrent a
 
 import time
 import uuid
+import functools
 import threading
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque
 from enum import Enum
 from abc import ABC
 
@@ -35,14 +36,52 @@ class SpotTypes(Enum):
     ACCESSIBLE = 3
     LARGE = 4
 
+# vehicle types each spot type takes
+_ALLOW = {
+    SpotTypes.SMALL: frozenset([VehicleTypes.BIKE]),
+    SpotTypes.COMPACT: frozenset([VehicleTypes.BIKE, VehicleTypes.CAR]),
+    SpotTypes.ACCESSIBLE: frozenset([VehicleTypes.BIKE, VehicleTypes.CAR]),
+    SpotTypes.LARGE: frozenset([VehicleTypes.BIKE, VehicleTypes.CAR, VehicleTypes.TRUCK]),
+}
+
+# spot types a vehicle fits in, smallest first; accessible spots come last
+# so they stay free for challenged drivers, who get them first instead
+_FITS = {
+    VehicleTypes.BIKE: (SpotTypes.SMALL, SpotTypes.COMPACT, SpotTypes.LARGE, SpotTypes.ACCESSIBLE),
+    VehicleTypes.CAR: (SpotTypes.COMPACT, SpotTypes.LARGE, SpotTypes.ACCESSIBLE),
+    VehicleTypes.TRUCK: (SpotTypes.LARGE,),
+}
+_FITS_CHALLENGED = {
+    vehicle_type: (SpotTypes.ACCESSIBLE,) + tuple(t for t in types if t != SpotTypes.ACCESSIBLE)
+    for vehicle_type, types in _FITS.items()
+}
+
+# vehicle type -> (base fee, per hour fee)
+_RATES = {
+    VehicleTypes.CAR: (50.0, 30.0),
+    VehicleTypes.BIKE: (30.0, 10.0),
+    VehicleTypes.TRUCK: (100.0, 50.0),
+}
+
+def _spot_types_for(vehicle):
+    # trucks have no is_challenged_driver
+    if getattr(vehicle, 'is_challenged_driver', False):
+        return _FITS_CHALLENGED[vehicle.type]
+    return _FITS[vehicle.type]
+
 
 class Vehicle(ABC):
 
+    # no per-instance __dict__, here or in the subclasses
+    __slots__ = ()
+
     def get_license(self):
         pass
 
 class Car(Vehicle):
 
+    __slots__ = ('type', '__license', 'is_challenged_driver')
+
     def __init__(self, license: str, is_challenged_driver: bool = False):
         self.type = VehicleTypes.CAR
         self.__license = license
@@ -53,6 +92,8 @@ class Car(Vehicle):
 
 class Truck(Vehicle):
 
+    __slots__ = ('type', '__license')
+
     def __init__(self, license: str):
         self.type = VehicleTypes.TRUCK
         self.__license = license
@@ -62,6 +103,8 @@ class Truck(Vehicle):
 
 class Bike(Vehicle):
 
+    __slots__ = ('type', '__license', 'is_challenged_driver')
+
     def __init__(self, license: str, is_challenged_driver: bool = False):
         self.type = VehicleTypes.BIKE
         self.__license = license
@@ -73,100 +116,87 @@ class Bike(Vehicle):
 
 
 class ParkingSpot(ABC):
+    """
+    Status, locking and the fit check live here once, the spot types only
+    say which type they are
+    """
 
-    def canFitVehicle(self, vehicle: Vehicle):
-        pass
+    # lots hold many spots, no per-instance __dict__ for any of them
+    __slots__ = ('id', '_status', 'type', 'allow_types', '_lock', 'floor')
 
-    def get_status(self):
-        pass
-
-    def set_status(self, status: aStatus):
-        pass
-
-class Small(ParkingSpot):
-
-    def __init__(self, id: int):
+    def __init__(self, id: int, type: SpotTypes):
         self.id = id
-        self.__status = aStatus.FREE
-        self.allow_types = [VehicleTypes.BIKE]
-        self.type = SpotTypes.SMALL
+        self._status = aStatus.FREE
+        self.type = type
+        self.allow_types = _ALLOW[type]
+        self._lock = threading.Lock()
+        self.floor = None # set by Floors.assign_spot
 
     def canFitVehicle(self, vehicle: Vehicle):
-        if vehicle.type not in self.allow_types:
-            return False
-        return True
+        return vehicle.type in self.allow_types
 
-    def set_status(self, status: aStatus):
-        self.__status = status
+    def _status_changed(self):
+        # keeps the floor's free spot index in step with FREE <-> OCCUPIED
+        if self.floor is not None:
+            self.floor.update_free(self)
 
     def get_status(self):
-        return self.__status
+        return self._status
 
+    def set_status(self, status: aStatus):
+        with self._lock:
+            self._status = status
+            self._status_changed()
+
+    def try_occupy(self):
+        # FREE -> OCCUPIED as one step, False if the spot was already taken
+        with self._lock:
+            if self._status != aStatus.FREE:
+                return False
+            self._status = aStatus.OCCUPIED
+            self._status_changed()
+            return True
 
-class Compact(ParkingSpot):
+class Small(ParkingSpot):
 
-    def __init__(self, id: int):
-        self.id = id
-        self.__status = aStatus.FREE
-        self.allow_types = [VehicleTypes.BIKE, VehicleTypes.CAR]
-        self.type = SpotTypes.COMPACT
+    __slots__ = ()
 
-    def canFitVehicle(self, vehicle: Vehicle):
-        if vehicle.type not in self.allow_types:
-            return False
-        return True
+    def __init__(self, id: int):
+        super().__init__(id, SpotTypes.SMALL)
 
-    def set_status(self, status: aStatus):
-        self.__status = status
 
-    def get_status(self):
-        return self.__status
+class Compact(ParkingSpot):
 
-class Accessible(ParkingSpot):
+    __slots__ = ()
 
     def __init__(self, id: int):
-        self.id = id
-        self.__status = aStatus.FREE
-        self.allow_types =  [VehicleTypes.BIKE, VehicleTypes.CAR]
-        self.type = SpotTypes.ACCESSIBLE
-
-    def canFitVehicle(self, vehicle: Vehicle):
-        if vehicle.type not in self.allow_types:
-            return False
-        return True
+        super().__init__(id, SpotTypes.COMPACT)
 
-    def set_status(self, status: aStatus):
-        self.__status = status
-
-    def get_status(self):
-        return self.__status
+class Accessible(ParkingSpot):
 
-class Large(ParkingSpot):
+    __slots__ = ()
 
     def __init__(self, id: int):
-        self.id = id
-        self.__status = aStatus.FREE
-        self.allow_types =  [VehicleTypes.BIKE, VehicleTypes.CAR, VehicleTypes.TRUCK]
-        self.type = SpotTypes.LARGE
+        super().__init__(id, SpotTypes.ACCESSIBLE)
 
-    def canFitVehicle(self, vehicle: Vehicle):
-        if vehicle.type not in self.allow_types:
-            return False
-        return True
+class Large(ParkingSpot):
 
-    def set_status(self, status: aStatus):
-        self.__status = status
+    __slots__ = ()
 
-    def get_status(self):
-        return self.__status
+    def __init__(self, id: int):
+        super().__init__(id, SpotTypes.LARGE)
 
 class ParkingTicket:
 
+    __slots__ = ('id', 'vehicle', 'spot', 'checkin', 'checkin_monotonic', '__status')
+
     def __init__(self, vehicle: Vehicle, spot: ParkingSpot):
         self.id = str(uuid.uuid4())
         self.vehicle = vehicle
         self.spot = spot
         self.checkin = datetime.now()
+        # for the fee, monotonic so a clock change can't skew the duration
+        self.checkin_monotonic = time.monotonic()
         self.__status = pStatus.UNPAID
 
     def get_status(self):
@@ -193,29 +223,79 @@ class ParkingFloors:
 
     def scan(self, vehicle: Vehicle):
         # return : {floor_level: [spots]}
+        # only walks the free spots of the types the vehicle fits in
+        spot_types = _spot_types_for(vehicle)
         result = defaultdict(list)
         for level, fobj in self.data.items():
-            for spot in fobj.spots:
-                if spot.get_status() == aStatus.FREE:
-                    if vehicle.is_challenged_driver and spot.type == SpotTypes.ACCESSIBLE :
-                        result[level].append(spot)
-                    else:
-                        if spot.canFitVehicle(vehicle):
-                            result[level].append(spot)
+            for spot_type in spot_types:
+                spots = fobj.free_spots(spot_type)
+                if spots:
+                    result[level].extend(spots)
         return result
 
+    def find_spot(self, vehicle: Vehicle):
+        # first free spot that fits, floor by floor, without building the
+        # whole scan() result; None if the lot is full for this vehicle
+        spot_types = _spot_types_for(vehicle)
+        for fobj in self.data.values():
+            for spot_type in spot_types:
+                spot = fobj.first_free(spot_type)
+                if spot is not None:
+                    return spot
+        return None
+
 
 class Floors:
 
     def __init__(self, level: int):
         self.level = level
-        self.spots = set()
+        # a list: assignment order is the scan order, the same on every run
+        self.spots = []
+        # spots queued by type as they become FREE, oldest first. Taking a
+        # spot doesn't remove it here, the readers skip and drop entries
+        # that were occupied or removed since; removing from the front of a
+        # dict or set would leave holes every later lookup steps over
+        self._free_by_type = defaultdict(deque)
+        # only for dropping stale entries, the free fast path takes no lock
+        self._stale_lock = threading.Lock()
 
     def assign_spot(self, spot: ParkingSpot):
-        self.spots.add(spot)
+        self.spots.append(spot)
+        spot.floor = self
+        self.update_free(spot)
 
     def remove_spot(self, spot: ParkingSpot):
         self.spots.remove(spot)
+        spot.floor = None
+
+    def update_free(self, spot: ParkingSpot):
+        if spot.get_status() == aStatus.FREE:
+            self._free_by_type[spot.type].append(spot)
+
+    def _is_free_here(self, spot: ParkingSpot):
+        return spot.get_status() == aStatus.FREE and spot.floor is self
+
+    def first_free(self, spot_type: SpotTypes):
+        queue = self._free_by_type[spot_type]
+        while True:
+            # peek, never pop a free spot: while it is out of the queue
+            # another thread would see this floor as full
+            try:
+                spot = queue[0]
+            except IndexError:
+                return None
+            if self._is_free_here(spot):
+                return spot
+            with self._stale_lock:
+                # another thread may have dropped it first, then the front
+                # is a different entry this thread hasn't checked yet
+                if queue and queue[0] is spot:
+                    queue.popleft()
+
+    def free_spots(self, spot_type: SpotTypes):
+        # a spot freed twice can be queued twice, dict.fromkeys dedups in order
+        return [spot for spot in dict.fromkeys(self._free_by_type[spot_type])
+                if self._is_free_here(spot)]
 
     def get_type_count(self):
         # in a particular floor , how many spots are there, with types
@@ -230,26 +310,16 @@ class Exit:
         self.id = id
 
     def calculate_fee(self):
-        type = self.ticket.vehicle.type
-        base_fee = 1
-        per_hour = 0
-        if type == VehicleTypes.CAR:
-            base_fee = 50.0
-            per_hour = 30.0
-        elif type == VehicleTypes.BIKE:
-            base_fee = 30.0
-            per_hour = 10.0
-        elif type == VehicleTypes.TRUCK:
-            base_fee = 100.0
-            per_hour = 50.0
-        num_hours = ((datetime.now() - self.ticket.checkin).total_seconds())/3600
+        base_fee, per_hour = _RATES[self.ticket.vehicle.type]
+        num_hours = (time.monotonic() - self.ticket.checkin_monotonic) / 3600
         total = base_fee + (per_hour * num_hours)
         return total
 
     def make_and_verify_payment(self, parking_ticket: ParkingTicket,
                             strategy: str ='Cash', card_num: str = None, upi_id: str = None):
         self.ticket = parking_ticket
-        p = PaymentFactory.get_payment_obj(strategy, card_num, upi_id)
+        # by keyword, the factory takes upi_id before card_num
+        p = PaymentFactory.get_payment_obj(strategy, upi_id=upi_id, card_num=card_num)
         if p.pay(self.calculate_fee()):
             self.unallocate_spot()
             self.ticket.set_status(pStatus.PAID)
@@ -268,26 +338,28 @@ class Entry:
         self.pf = parkingfloors
 
     def search_spot(self, vehicle):
-        data = self.pf.scan(vehicle)
-        self.spot = None
-        for _, spots in data.items():
-            if len(spots) > 0:
-                self.spot = spots[0]
-                break
-        if not self.spot:
+        # only a candidate, another entry can still claim it first
+        spot = self.pf.find_spot(vehicle)
+        if not spot:
             raise Exception("Parking Full!!")
-        print(f"Spot Found: {self.spot.id} for vehicle type: {vehicle.type}")
+        print(f"Spot Found: {spot.id} for vehicle type: {vehicle.type}")
+        return spot
 
-    def allocate_spot(self):
-        lock = threading.Lock()
-        with lock:
-            self.spot.set_status(aStatus.OCCUPIED)
-            print(f"{self.spot.type} spot {self.spot.id} status set to OCCUPIED!")
+    def allocate_spot(self, spot: ParkingSpot):
+        # the check and the set happen under the spot's own lock, so two
+        # entries can't both get it
+        if not spot.try_occupy():
+            return False
+        print(f"{spot.type} spot {spot.id} status set to OCCUPIED!")
+        return True
 
     def issue_ticket(self, vehicle: Vehicle):
-        self.search_spot(vehicle)
-        self.allocate_spot()
-        ticket = ParkingTicket(vehicle, self.spot)
+        # locals, one Entry can issue tickets on several threads
+        spot = self.search_spot(vehicle)
+        while not self.allocate_spot(spot):
+            # whoever won already took it out of the free index
+            spot = self.search_spot(vehicle)
+        ticket = ParkingTicket(vehicle, spot)
         print("Ticket Issued!!")
         return ticket
 
@@ -330,16 +402,29 @@ class Cash(Payment):
         print("Payment completed!")
         return True
 
+# payment objects keep nothing but their id, so exits share them instead
+# of building one per payment
+_CASH = Cash()
+
+@functools.lru_cache(maxsize=1024)
+def _card(card_num: str):
+    return Card(card_num)
+
+@functools.lru_cache(maxsize=1024)
+def _upi(upi_id: str):
+    return UPI(upi_id)
+
 class PaymentFactory:
 
     @staticmethod
     def get_payment_obj(strategy: str = 'Cash', upi_id: str = None, card_num: str = None):
-        if strategy.lower() == 'cash':
-            pobj = Cash()
-        elif strategy.lower() == 'card':
-            pobj = Card(card_num)
-        elif strategy.lower() == 'upi':
-            pobj = UPI(upi_id)
+        strategy = strategy.lower()
+        if strategy == 'cash':
+            pobj = _CASH
+        elif strategy == 'card':
+            pobj = _card(card_num)
+        elif strategy == 'upi':
+            pobj = _upi(upi_id)
         else:
             raise Exception("Unknown payment method!, we accept only cash | credit | upi")
         return pobj
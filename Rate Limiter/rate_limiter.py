@@ -1,34 +1,34 @@
 import time
-from collections import defaultdict
-from datetime import datetime, timedelta
+
+WINDOW_NS = 10 * 1_000_000_000
 
 class RateLimiter:
 
     def __init__(self):
-        self.track_dict = defaultdict(datetime)
         self.limit_per_10_sec = 5
-        self.timer = None
+        # time.monotonic_ns() the window started at: an int, and clock
+        # changes can't stretch or shrink the window
+        self.start_ns = None
         self.counter = 0
-        # track_dict = {time: count}
 
     def allow_request(self, user_id: str) -> bool:
-        if not self.timer:
-            self.timer = datetime.now()
+        now_ns = time.monotonic_ns()
+        if self.start_ns is None:
+            self.start_ns = now_ns
             if self.counter < self.limit_per_10_sec:
                 self.counter += 1
             print("First time, Allowed!")
         else:
-            print(self.timer, datetime.now())
-            diff = datetime.now() - self.timer 
-            print(diff.total_seconds())
-            if diff.total_seconds() <= 10:
+            diff_ns = now_ns - self.start_ns
+            print(diff_ns / 1_000_000_000)
+            if diff_ns <= WINDOW_NS:
                 if self.counter >= self.limit_per_10_sec:
                     print("Limit exceeded, please wait for few seconds and retry")
                 else:
                     self.counter += 1
                     print("Allowed!")
             else:
-                self.timer = datetime.now()
+                self.start_ns = now_ns
                 self.counter = 1
                 print("Reset to next 10 seconds, Allowed!")
 
@@ -1,44 +1,54 @@
 import time
 import threading
-from collections import defaultdict
-from datetime import datetime, timedelta
 
 class RateLimiter:
+    """
+    Fixed window per user. Users are spread over SHARDS dicts by hash, a
+    shard's lock is only taken to add a new user, and each user's own lock
+    only around its count, so unrelated users never wait on each other.
+    """
+
+    SHARDS = 16 # power of two, picked with a mask
 
     def __init__(self, max_requests: int = 5, window_time: int = 10):
-        self.track_dict = defaultdict(dict)
         self.max_requests = max_requests
         self.window_time = window_time
-        self.user_locks = defaultdict(threading.Lock)
+        # the window check compares ints, no float / datetime per request
+        self.window_ns = int(window_time * 1_000_000_000)
+        # user_id -> [window start (monotonic_ns), count in window, lock]
+        self._shards = [{} for _ in range(self.SHARDS)]
+        self._shard_locks = [threading.Lock() for _ in range(self.SHARDS)]
 
     def allow_request(self, user_id: str) -> bool:
-        with self.user_locks[user_id]:
-            if not self.track_dict[user_id]:
-                self.track_dict[user_id] = { 'requested_time': datetime.now(), 'count': 0 }
-                self.track_dict[user_id]['count'] += 1
-                print("First time, Allowed!")
-                return True
-            else:
-                #print(self.track_dict[user_id]['requested_time'], datetime.now())
-                diff = datetime.now() - self.track_dict[user_id]['requested_time']
-                #print(diff.total_seconds())
-                if diff.total_seconds() <= self.window_time:
-                    if self.track_dict[user_id]['count'] >= self.max_requests:
-                        print("Limit exceeded, please wait for few seconds and retry")
-                        return False
-                    else:
-                        self.track_dict[user_id]['count'] += 1
-                        print("Allowed!")
-                        return True
-                else:
-                    self.track_dict[user_id]['requested_time'] = datetime.now()
-                    self.track_dict[user_id]['count'] = 1
-                    print("Reset to next 10 seconds, Allowed!")
+        index = hash(user_id) & (self.SHARDS - 1)
+        shard = self._shards[index]
+        # a known user is a plain dict read, no shard lock
+        entry = shard.get(user_id)
+        if entry is None:
+            with self._shard_locks[index]:
+                # checked again, another thread may have added the user meanwhile
+                entry = shard.get(user_id)
+                if entry is None:
+                    shard[user_id] = [time.monotonic_ns(), 1, threading.Lock()]
+                    print("First time, Allowed!")
                     return True
-
+        with entry[2]:
+            now_ns = time.monotonic_ns()
+            if now_ns - entry[0] <= self.window_ns:
+                if entry[1] >= self.max_requests:
+                    print("Limit exceeded, please wait for few seconds and retry")
+                    return False
+                entry[1] += 1
+                print("Allowed!")
+                return True
+            entry[0] = now_ns
+            entry[1] = 1
+            print("Reset to next 10 seconds, Allowed!")
+            return True
 
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 def make_requests(rate_limiter, user_id):
     for _ in range(3):
@@ -48,12 +58,9 @@ def make_requests(rate_limiter, user_id):
 
 if __name__ == "__main__":
     rl = RateLimiter(max_requests=5, window_time=10)
-    threads = []
-
-    for i in range(10):
-        t = threading.Thread(target=make_requests, args=(rl, "user123"), name=f"T{i}")
-        threads.append(t)
-        t.start()
 
-    for t in threads:
-        t.join()
+    # 10 clients on a fixed pool of 4 reused threads, not a thread per client
+    with ThreadPoolExecutor(max_workers=4, thread_name_prefix="T") as executor:
+        futures = [executor.submit(make_requests, rl, "user123") for _ in range(10)]
+        for future in futures:
+            future.result()
@@ -13,109 +13,138 @@ I/O : Mostly input/output operations, third party involved
 - There is overlapping but not parallel
 """
 
-import threading
+import os
 import time 
-
-start = time.perf_counter()
+import threading
+import concurrent.futures
 
 def sleeping():
     print("Start sleeping")
     time.sleep(1)
     print("Done Sleeping")
 
-#sleeping()
-#sleeping()
-""""
-thread1 = threading.Thread(target=sleeping)
-thread2 = threading.Thread(target=sleeping)
+def sleep_arg(seconds):
+    print(f'Sleeping for {seconds}')
+    time.sleep(seconds)
+    return (f'Done sleeping for {seconds}')
 
-thread1.start()
-thread2.start()
+def cpu_crunch(n):
+    return sum(i*i for i in range(n))
 
-# wait for the thread to complete
-# otherwise it will just proceed to next lines without completing
-thread1.join()
-thread2.join()
-"""
+# all the demos live in main(): with spawned processes (windows / macOS)
+# every pool worker imports this file again, and must only get the
+# functions above, not rerun the demos before it picks up its task
+def main():
+    start = time.perf_counter()
 
-threads = []
+    #sleeping()
+    #sleeping()
+    """"
+    thread1 = threading.Thread(target=sleeping)
+    thread2 = threading.Thread(target=sleeping)
 
-# Looping method for threads
-for _ in range(10):
-    thread = threading.Thread(target=sleeping)
-    thread.start()
-    # adding join here will be same as running without thread 
-    threads.append(thread)
+    thread1.start()
+    thread2.start()
 
-for thread in threads:
-    thread.join()
+    # wait for the thread to complete
+    # otherwise it will just proceed to next lines without completing
+    thread1.join()
+    thread2.join()
+    """
 
-end = time.perf_counter()
-print(f"Time taken: {round(end-start,2)} seconds")
+    threads = []
 
+    # Looping method for threads
+    for _ in range(10):
+        thread = threading.Thread(target=sleeping)
+        thread.start()
+        # adding join here will be same as running without thread 
+        threads.append(thread)
 
-# Passing arguments
+    for thread in threads:
+        thread.join()
 
-start = time.perf_counter()
-def sleep_arg(seconds):
-    print(f'Sleeping for {seconds}')
-    time.sleep(seconds)
-    return (f'Done sleeping for {seconds}')
+    end = time.perf_counter()
+    print(f"Time taken: {round(end-start,2)} seconds")
 
-threads = []
 
-# Looping method for threads
-for _ in range(10):
-    thread = threading.Thread(target=sleep_arg, args=[1.5])
-    thread.start()
-    # adding join here will be same as running without thread 
-    threads.append(thread)
+    # Passing arguments
 
-for thread in threads:
-    thread.join()
+    start = time.perf_counter()
+    threads = []
 
-end = time.perf_counter()
-print(f"Time taken: {round(end-start,2)} seconds")
+    # Looping method for threads
+    for _ in range(10):
+        thread = threading.Thread(target=sleep_arg, args=[1.5])
+        thread.start()
+        # adding join here will be same as running without thread 
+        threads.append(thread)
 
-print('*'*30)
+    for thread in threads:
+        thread.join()
 
-# Using thread pool executor
-import concurrent.futures
+    end = time.perf_counter()
+    print(f"Time taken: {round(end-start,2)} seconds")
 
-start = time.perf_counter()
-with concurrent.futures.ThreadPoolExecutor() as executor:
-    f1 = executor.submit(sleep_arg, 1)
-    f2 = executor.submit(sleep_arg, 1)
-    print(f1.result()) # wait untill the function completes
-    print(f2.result()) 
-end = time.perf_counter()
-print(f"Time taken: {round(end-start,2)} seconds")
-
-print('*'*30)
-
-start = time.perf_counter()
-# with looping and list argument
-with concurrent.futures.ThreadPoolExecutor() as executor:
-    seconds = [5,4,3,2,1]
-    result = [executor.submit(sleep_arg, sec) for sec in seconds]
+    print('*'*30)
+
+    # Using thread pool executor
+
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        f1 = executor.submit(sleep_arg, 1)
+        f2 = executor.submit(sleep_arg, 1)
+        print(f1.result()) # wait untill the function completes
+        print(f2.result()) 
+    end = time.perf_counter()
+    print(f"Time taken: {round(end-start,2)} seconds")
+
+    print('*'*30)
+
+    start = time.perf_counter()
+    # with looping and list argument
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        seconds = [5,4,3,2,1]
+        result = [executor.submit(sleep_arg, sec) for sec in seconds]
     
-    # we can use the iterator method of that module
-    for f in concurrent.futures.as_completed(result):
-        print(f.result())
-end = time.perf_counter()
-print(f"Time taken: {round(end-start,2)} seconds")
-
-print('*'*30)
-
-# using executor.map 
-start = time.perf_counter()
-# with looping and list argument
-with concurrent.futures.ThreadPoolExecutor() as executor:
-    seconds = [5,4,3,2,1]
-    results = executor.map(sleep_arg, seconds)  # this will automatically wait for the threads to complete
-
-    for result in results:
-        print(result)
-
-end = time.perf_counter()
-print(f"Time taken: {round(end-start,2)} seconds")
\ No newline at end of file
+        # we can use the iterator method of that module
+        for f in concurrent.futures.as_completed(result):
+            print(f.result())
+    end = time.perf_counter()
+    print(f"Time taken: {round(end-start,2)} seconds")
+
+    print('*'*30)
+
+    # using executor.map 
+    start = time.perf_counter()
+    # with looping and list argument
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        seconds = [5,4,3,2,1]
+        results = executor.map(sleep_arg, seconds)  # this will automatically wait for the threads to complete
+
+        for result in results:
+            print(result)
+
+    end = time.perf_counter()
+    print(f"Time taken: {round(end-start,2)} seconds")
+
+    print('*'*30)
+
+    # CPU bound: threads take turns on the GIL, processes really run in parallel
+    numbers = [5_000_000] * 8
+
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        results = list(executor.map(cpu_crunch, numbers))
+    end = time.perf_counter()
+    print(f"Threads, time taken: {round(end-start,2)} seconds")
+
+    start = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(cpu_crunch, numbers))
+    end = time.perf_counter()
+    print(f"Processes, time taken: {round(end-start,2)} seconds")
+
+
+if __name__ == "__main__":
+    main()
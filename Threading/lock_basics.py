@@ -1,17 +1,30 @@
 import time
-from threading import Thread, Lock 
+from threading import Thread, Lock, Barrier
 
 x = 0
+N = 1000000
 
+# both threads start counting together, so their loops really overlap
+start_together = Barrier(2)
+
+def changed(value, delta):
+    return value + delta
+
+# x = changed(x, ...) reads x, calls, then writes x back: the interpreter
+# can switch threads inside the call, so updates will very likely get lost
+# (not guaranteed, a run can still come out right; a bare x += 1 rarely
+# switches mid-way at all)
 def add_one():
     global x 
-    for _ in range(1000000):
-        x += 1
+    start_together.wait()
+    for _ in range(N):
+        x = changed(x, 1)
 
 def subtract_one():
     global x
-    for _ in range(10000000):
-        x -= 1
+    start_together.wait()
+    for _ in range(N):
+        x = changed(x, -1)
 
 thread1 = Thread(target=add_one)
 thread2 = Thread(target=subtract_one)
@@ -22,7 +35,7 @@ thread1.join()
 thread2.join()
 
 print(x)  # 0 is right value
-# but we got  -9639804 --> race condition occurred
+# but it usually isn't, e.g. -156213 --> race condition occurred
 import sys
 print = lambda x: sys.stdout.write("%s\n" % x)  # avoid new line problems
 lock = Lock()
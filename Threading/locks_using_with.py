@@ -13,22 +13,17 @@ from threading import Thread, Lock
 
 lock = Lock()
 
+# same acquire / release as above, the with block releases the lock
+# even if the critical section raises
 def func1():
-    lock.acquire()
-    print("Thread1 acquired lock")
-    time.sleep(3)
-    lock.release()
+    with lock:
+        print("Thread1 acquired lock")
+        time.sleep(3)
 
 def func2():
-    while True:
-        if lock.acquire(blocking=False):
-            print("Thread2 acquired lock")
-            time.sleep(4)
-            lock.release()
-            break
-        else:
-            print("Doing something else")
-            time.sleep(1)
+    with lock:
+        print("Thread2 acquired lock")
+        time.sleep(4)
 
 thread1 = Thread(target=func1)
 thread2 = Thread(target=func2)